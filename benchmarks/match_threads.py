@@ -0,0 +1,109 @@
+"""
+Stress benchmark of the pook matching engine under concurrent threads.
+
+Registers a set of mocks in a ``pook.Engine`` and matches outgoing requests
+against them from a growing number of threads, reporting the matching
+throughput and its speedup over a single thread.
+
+On free-threaded Python builds (``python3.13t`` and later) throughput should
+scale with the number of threads, since matching does not rely on a global
+engine lock.
+
+Run it via:
+
+.. code:: bash
+
+    $ python benchmarks/match_threads.py --threads 1 2 4 8 16 32
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pook import Engine, Request
+
+
+def gil_status():
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None:
+        return "enabled"
+    return "enabled" if is_gil_enabled() else "disabled"
+
+
+def setup_engine(hosts):
+    engine = Engine()
+    engine.debug = False
+
+    for host in range(hosts):
+        url = f"http://host-{host}.com/api/users?page=1"
+        engine.mock(url, method="POST").type("json").json(
+            {"name": "foo", "roles": ["admin", "user"]}
+        ).persist()
+
+    return engine
+
+
+def build_requests(hosts, count):
+    return [
+        Request(
+            method="POST",
+            url=f"http://host-{index % hosts}.com/api/users?page=1",
+            headers={"Content-Type": "application/json"},
+            json={"name": "foo", "roles": ["admin", "user"]},
+        )
+        for index in range(count)
+    ]
+
+
+def run(engine, requests, threads):
+    def worker(chunk):
+        for request in chunk:
+            engine.match(request)
+
+    chunks = [requests[index::threads] for index in range(threads)]
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        for result in executor.map(worker, chunks):
+            pass
+        return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--threads",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16, 32],
+        help="number of threads to benchmark",
+    )
+    parser.add_argument("--hosts", type=int, default=50, help="number of mocked hosts")
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=20000,
+        help="number of matched requests per run",
+    )
+    args = parser.parse_args(argv)
+
+    engine = setup_engine(args.hosts)
+    requests = build_requests(args.hosts, args.requests)
+
+    print(f"Python {sys.version.split()[0]} (GIL {gil_status()})")
+    print(f"{'threads':>8} {'seconds':>10} {'req/s':>12} {'speedup':>8}")
+
+    baseline = None
+    for threads in args.threads:
+        elapsed = run(engine, requests, threads)
+        throughput = len(requests) / elapsed
+        baseline = baseline or throughput
+        print(
+            f"{threads:>8} {elapsed:>10.3f} {throughput:>12.0f}"
+            f" {throughput / baseline:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -37,6 +37,10 @@ __all__ = (
     "MatcherEngine",  # noqa: F405
     "MockEngine",  # noqa: F405
     "use_network_filter",  # noqa: F405
+    "retain",  # noqa: F405
+    "delay",  # noqa: F405
+    "enable_virtual_clock",  # noqa: F405
+    "disable_virtual_clock",  # noqa: F405
 )
 
 # Package metadata
@@ -1,5 +1,7 @@
 import functools
 import re
+import threading
+from contextvars import ContextVar
 from inspect import iscoroutinefunction
 from contextlib import contextmanager
 from inspect import isfunction
@@ -49,11 +51,64 @@ __all__ = (
     "MatcherEngine",
     "MockEngine",
     "use_network_filter",
+    "retain",
+    "delay",
+    "enable_virtual_clock",
+    "disable_virtual_clock",
 )
 
 # Default singleton mock engine to be used
 _engine = Engine()
 
+# Stores the engine bound to the current execution context by ``use()``
+_context_engine = ContextVar("pook_engine", default=None)
+
+# Stores the engines bound by ``use()``, in binding order
+_bound_engines = []
+
+# Stores the engine intercepting the HTTP traffic of the bound engines
+_dispatcher = None
+
+# Stores the default engine interceptors, parked while engines are bound
+_parked = None
+
+# Guards the bound engines state
+_lock = threading.Lock()
+
+
+def _current():
+    """
+    Resolves the engine bound to the current execution context, falling
+    back to the default engine.
+
+    Returns:
+        pook.Engine: current engine.
+    """
+    engine = _context_engine.get()
+    return _engine if engine is None else engine
+
+
+class DispatcherEngine(Engine):
+    """
+    Engine that intercepts the HTTP traffic on behalf of the engines bound
+    by ``pook.use()``, dispatching every outgoing request to the engine
+    bound to the execution context that sends it, or to the default engine.
+
+    Patching HTTP clients is process-wide, so a single set of interceptors
+    is shared by all the bound engines and the default engine instead of
+    stacking patches that could be restored out of order by concurrent
+    contexts.
+    """
+
+    def match(self, request):
+        engine = _current()
+
+        # Disabled engines do not intercept any traffic
+        if not engine.active:
+            return None
+
+        return engine.match(request)
+
 
 def debug(enable=True):
     """
@@ -62,7 +117,7 @@ def debug(enable=True):
     Arguments:
         enable (bool): ``True`` to enable debug mode. Otherwise ``False``.
     """
-    _engine.debug = enable
+    _current().debug = enable
 
 
 def engine():
@@ -72,7 +127,7 @@ def engine():
     Returns:
         pook.Engine: current used engine.
     """
-    return _engine
+    return _current()
 
 
 def set_mock_engine(engine):
@@ -87,7 +142,7 @@ def set_mock_engine(engine):
     Arguments:
         engine (pook.MockEngine): custom mock engine to use.
     """
-    _engine.set_mock_engine(engine)
+    _current().set_mock_engine(engine)
 
 
 def activate(fn=None):
@@ -124,21 +179,22 @@ def activate(fn=None):
     """
     # If not used as decorator, activate the engine and exit
     if not isfunction(fn):
-        _engine.activate()
+        _current().activate()
         return None
 
     # If used as decorator for an async coroutine, wrap it
     if iscoroutinefunction(fn):
-        return activate_async(fn, _engine)
+        return activate_async(fn, _current())
 
     @functools.wraps(fn)
     def wrapper(*args, **kw):
-        _engine.activate()
+        engine = _current()
+        engine.activate()
         try:
             fn(*args, **kw)
         finally:
-            _engine.disable()
-            _engine.reset()
+            engine.disable()
+            engine.reset()
 
     return wrapper
 
@@ -179,7 +235,7 @@ def disable():
     """
     Disables HTTP traffic interceptors.
     """
-    _engine.disable()
+    _current().disable()
 
 
 def off():
@@ -199,7 +255,7 @@ def reset():
 
     This action will not disable the mock engine.
     """
-    _engine.reset()
+    _current().reset()
 
 
 @contextmanager
@@ -207,6 +263,12 @@ def use(network=False):
     """
     Creates a new isolated mock engine to be used via context manager.
 
+    The engine is bound to the current execution context, so concurrent
+    threads and ``asyncio`` tasks can use their own isolated engine at the
+    same time. Threads that do not inherit the execution context, such as
+    plain ``threading.Thread`` workers, use the default engine. Run them
+    with ``contextvars.copy_context().run()`` to use the bound engine.
+
     Example::
 
         with pook.use() as engine:
@@ -215,29 +277,57 @@ def use(network=False):
             res = requests.get('server.com/foo')
             assert res.status_code == 404
     """
-    global _engine
-
-    # Create temporal engine
-    __engine = _engine
-    activated = __engine.active
-    if activated:
-        __engine.disable()
-
-    _engine = Engine(network=network)
-    _engine.activate()
-
-    # Yield engine to be used by the context manager
-    yield _engine
-
-    # Restore engine state
-    _engine.disable()
-    if network:
-        _engine.disable_network()
-
-    # Restore previous engine
-    _engine = __engine
-    if activated:
-        _engine.activate()
+    global _dispatcher, _parked
+
+    # Create the isolated engine. Its traffic is intercepted by the shared
+    # dispatcher engine, so it does not patch HTTP clients on its own.
+    engine = Engine(network=network)
+    engine.flush_interceptors()
+    engine.activate()
+
+    token = _context_engine.set(engine)
+    with _lock:
+        if not _bound_engines:
+            # Park the default engine interceptors until every isolated
+            # engine is gone, since the dispatcher intercepts its traffic
+            if _engine.active:
+                _engine.mock_engine.disable()
+            _parked = _engine.mock_engine, _engine.mock_engine.interceptors
+            _engine.flush_interceptors()
+
+            _dispatcher = DispatcherEngine()
+            _dispatcher.activate()
+        _bound_engines.append(engine)
+
+    try:
+        # Yield engine to be used by the context manager
+        yield engine
+    finally:
+        # Restore engine state
+        engine.disable()
+        if network:
+            engine.disable_network()
+
+        with _lock:
+            _bound_engines.remove(engine)
+            if not _bound_engines:
+                _dispatcher.disable()
+                _dispatcher = None
+
+                # Unpark the default engine interceptors, unless replaced
+                mock_engine, interceptors = _parked
+                _parked = None
+                if _engine.mock_engine is mock_engine:
+                    mock_engine.interceptors = interceptors
+                    if _engine.active:
+                        mock_engine.activate()
+
+        # Restore the previous engine
+        try:
+            _context_engine.reset(token)
+        except ValueError:
+            # Exited from a different execution context
+            _context_engine.set(None)
 
 
 @contextmanager
@@ -281,14 +371,14 @@ def enable_network(*hostnames):
     Enables real networking mode for unmatched mocks in the current
     mock engine.
     """
-    _engine.enable_network(*hostnames)
+    _current().enable_network(*hostnames)
 
 
 def disable_network():
     """
     Disables real traffic networking mode in the current mock engine.
     """
-    _engine.disable_network()
+    _current().disable_network()
 
 
 def use_network_filter(*fn):
@@ -299,7 +389,7 @@ def use_network_filter(*fn):
     Arguments:
         *fn (function): variadic function filter arguments to be used.
     """
-    _engine.use_network_filter(*fn)
+    _current().use_network_filter(*fn)
 
 
 def flush_network_filters():
@@ -307,7 +397,59 @@ def flush_network_filters():
     Flushes registered real networking filters in the current
     mock engine.
     """
-    _engine.flush_network_filters()
+    _current().flush_network_filters()
+
+
+def retain(limit=None, sample=1, bodies=True):
+    """
+    Configures the retention policy of the matched and unmatched requests
+    in the current mock engine.
+
+    See ``pook.Engine.retain()`` for more information.
+
+    Arguments:
+        limit (int): maximum number of retained requests.
+        sample (int): retains one of every ``sample`` requests.
+        bodies (bool): retains the request bodies.
+    """
+    _current().retain(limit=limit, sample=sample, bodies=bodies)
+
+
+def delay(delay=1000):
+    """
+    Sets the default network response delay of the mocks in the current
+    mock engine.
+
+    See ``pook.Engine.delay()`` for more information.
+
+    Arguments:
+        delay (int): milliseconds to delay responses.
+    """
+    _current().delay(delay)
+
+
+def enable_virtual_clock(timeouts=False):
+    """
+    Enables the virtual clock mode in the current mock engine, where the
+    mocks response delays advance a simulated clock instead of waiting.
+
+    See ``pook.Engine.enable_virtual_clock()`` for more information.
+
+    Arguments:
+        timeouts (bool): raises the HTTP client timeout errors when a mock
+            response delay exceeds the client read timeout.
+
+    Returns:
+        pook.clock.VirtualClock: the virtual clock.
+    """
+    return _current().enable_virtual_clock(timeouts=timeouts)
+
+
+def disable_virtual_clock():
+    """
+    Disables the virtual clock mode in the current mock engine.
+    """
+    _current().disable_virtual_clock()
 
 
 def mock(url=None, **kw):
@@ -323,7 +465,7 @@ def mock(url=None, **kw):
     Returns:
         pook.Mock: mock instance
     """
-    return _engine.mock(url, **kw)
+    return _current().mock(url, **kw)
 
 
 def get(url, **kw):
@@ -445,7 +587,7 @@ def pending():
     Returns:
         int: number of pending mocks to match.
     """
-    return _engine.pending()
+    return _current().pending()
 
 
 def ispending():
@@ -455,7 +597,7 @@ def ispending():
     Returns:
         int: number of pending mocks to match.
     """
-    return _engine.ispending()
+    return _current().ispending()
 
 
 def pending_mocks():
@@ -465,7 +607,7 @@ def pending_mocks():
     Returns:
         list: pending mock instances.
     """
-    return _engine.pending_mocks()
+    return _current().pending_mocks()
 
 
 def unmatched_requests():
@@ -478,7 +620,7 @@ def unmatched_requests():
     Returns:
         list: unmatched intercepted requests.
     """
-    return _engine.unmatched_requests()
+    return _current().unmatched_requests()
 
 
 def unmatched():
@@ -491,7 +633,7 @@ def unmatched():
     Returns:
         int: total number of unmatched requests.
     """
-    return _engine.unmatched()
+    return _current().unmatched()
 
 
 def isunmatched():
@@ -504,7 +646,7 @@ def isunmatched():
     Returns:
         bool
     """
-    return _engine.isunmatched()
+    return _current().isunmatched()
 
 
 def isactive():
@@ -515,7 +657,7 @@ def isactive():
     Returns:
         bool: True if pook is active, otherwise False.
     """
-    return _engine.isactive()
+    return _current().isactive()
 
 
 def isdone():
@@ -525,7 +667,7 @@ def isdone():
     Returns:
         bool: True if all the registered mocks are gone, otherwise False.
     """
-    return _engine.isdone()
+    return _current().isdone()
 
 
 def regex(expression, flags=re.IGNORECASE):
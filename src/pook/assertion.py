@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from .regex import isregex, isregex_expr, strip_regex
+from . import comparator
 
 
 def test_case():
@@ -15,9 +15,16 @@ def test_case():
     return test
 
 
+def _assert(result):
+    # Mismatch messages are rendered when the error is printed
+    if not result:
+        raise AssertionError(result)
+    return True
+
+
 def equal(x, y):
     """
-    Shortcut function for ``unittest.TestCase.assertEqual()``.
+    Asserts that two values are equal.
 
     Arguments:
         x (mixed)
@@ -29,13 +36,12 @@ def equal(x, y):
     Returns:
         bool
     """
-    return test_case().assertEqual(x, y) or True
+    return _assert(comparator.equal(x, y))
 
 
 def matches(x, y, regex_expr=False):
     """
     Tries to match a regular expression value ``x`` against ``y``.
-    Aliast``unittest.TestCase.assertEqual()``
 
     Arguments:
         x (regex|str): regular expression to test.
@@ -48,14 +54,7 @@ def matches(x, y, regex_expr=False):
     Returns:
         bool
     """
-    # Parse regex expression, if needed
-    x = strip_regex(x) if regex_expr and isregex_expr(x) else x
-
-    if isinstance(getattr(x, "pattern", None), str) and hasattr(y, "decode"):
-        y = y.decode("utf-8", "backslashescape")
-
-    # Assert regular expression via unittest matchers
-    return test_case().assertRegex(y, x) or True
+    return _assert(comparator.matches(x, y, regex_expr=regex_expr))
 
 
 def test(x, y, regex_expr=False):
@@ -74,4 +73,4 @@ def test(x, y, regex_expr=False):
     Returns:
         bool
     """
-    return matches(x, y, regex_expr=regex_expr) if isregex(x) else equal(x, y)
+    return _assert(comparator.test(x, y, regex_expr=regex_expr))
@@ -0,0 +1,199 @@
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from unittest import mock
+
+# Stores the real time functions, since they can be patched by clocks
+_monotonic = time.monotonic
+_sleep = time.sleep
+
+# Stores the virtual time drivers of the asyncio loops, by loop
+_loops = weakref.WeakKeyDictionary()
+
+
+class _LoopDriver:
+    """
+    Drives the time of an ``asyncio`` loop with a virtual clock, jumping to
+    the next loop timer whenever the loop is idle while virtual sleeps are
+    pending.
+
+    The loop time starts at the real time and never goes backwards, even
+    when another clock drives the loop, so already scheduled timers are not
+    moved.
+    """
+
+    def __init__(self, loop, clock):
+        # Loops not based on selectors, or implemented as extension types,
+        # such as uvloop, raise AttributeError
+        selector = loop._selector
+        self._select = selector.select
+        selector.select = self.select
+        loop.time = self.time
+
+        self.clock = clock
+        self.base = clock.offset
+        # Stores the number of virtual sleeps pending in the loop
+        self.sleeping = 0
+
+    def time(self):
+        return self.clock.monotonic() - self.base
+
+    def plug(self, clock):
+        now = self.time()
+        self.clock = clock
+        self.base = clock.monotonic() - now
+
+    def select(self, timeout=None):
+        # The loop is only idle if it would block without ready I/O events
+        if not self.sleeping or not timeout:
+            return self._select(timeout)
+
+        events = self._select(0)
+        if not events:
+            # Jump to the next loop timer, such as the earliest sleep deadline
+            self.clock.advance(timeout)
+        return events
+
+
+class Clock:
+    """
+    Clock used by the engine to simulate the mocks response delays, by
+    waiting in real time.
+    """
+
+    def monotonic(self):
+        """
+        Returns the current monotonic time in seconds.
+
+        Returns:
+            float
+        """
+        return _monotonic()
+
+    def sleep(self, seconds):
+        """
+        Blocks the current thread during the given seconds.
+
+        Arguments:
+            seconds (float): seconds to sleep.
+        """
+        _sleep(seconds)
+
+    async def asleep(self, seconds):
+        """
+        Asynchronously sleeps during the given seconds.
+
+        Arguments:
+            seconds (float): seconds to sleep.
+        """
+        await asyncio.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """
+    VirtualClock simulates the mocks response delays by advancing a virtual
+    time, instead of waiting, so delays and timeouts run at CPU speed.
+
+    The virtual time is the real monotonic time plus the time advanced by
+    the clock. Every clock keeps its own virtual time, so the delays of an
+    engine do not move the time of other engines.
+
+    Running ``asyncio`` loops are plugged into the virtual time. Sleeps
+    wait until their deadline, and idle loops jump to the earliest pending
+    one, so concurrent sleeps overlap as in real time instead of adding up,
+    and loop timers, such as HTTP client timeouts, expire natively. Loops
+    keep the virtual time once plugged, since going back to the real time
+    would delay their already scheduled timers.
+
+    Example::
+
+        clock = pook.enable_virtual_clock()
+
+        # Make time.sleep() and time.monotonic() consumers use the clock
+        with clock.patch():
+            ...
+
+    Attributes:
+        offset (float): time advanced by the clock in seconds.
+    """
+
+    def __init__(self):
+        self.offset = 0.0
+        self._lock = threading.Lock()
+
+    def monotonic(self):
+        return _monotonic() + self.offset
+
+    def advance(self, seconds):
+        """
+        Advances the virtual time.
+
+        Arguments:
+            seconds (float): seconds to advance.
+
+        Raises:
+            ValueError: if seconds is negative.
+        """
+        if seconds < 0:
+            raise ValueError("virtual time cannot go backwards")
+
+        with self._lock:
+            self.offset += seconds
+
+    def sleep(self, seconds):
+        # Wait until the sleep deadline, so sleeps started before the
+        # clock advanced overlap
+        deadline = self.offset + seconds
+        with self._lock:
+            self.offset = max(self.offset, deadline)
+
+    def _driver(self, loop):
+        driver = _loops.get(loop)
+        if driver is None:
+            try:
+                driver = _loops[loop] = _LoopDriver(loop, self)
+            except AttributeError:
+                return None
+        elif driver.clock is not self:
+            driver.plug(self)
+        return driver
+
+    def install(self, loop=None):
+        """
+        Makes the given ``asyncio`` loop use the virtual time.
+
+        Arguments:
+            loop (asyncio.AbstractEventLoop): loop to use. Defaults to the
+                running loop.
+
+        Returns:
+            bool: ``True`` if the loop uses the virtual time, ``False`` if
+                it does not support it.
+        """
+        return self._driver(loop or asyncio.get_running_loop()) is not None
+
+    async def asleep(self, seconds):
+        driver = self._driver(asyncio.get_running_loop())
+        if driver is None:
+            self.sleep(seconds)
+            await asyncio.sleep(0)
+            return
+
+        driver.sleeping += 1
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            driver.sleeping -= 1
+
+    @contextmanager
+    def patch(self):
+        """
+        Patches ``time.monotonic()`` and ``time.sleep()`` to use the virtual
+        time, so sleeps in client code, such as retry backoffs, advance the
+        virtual time instead of waiting.
+        """
+        with mock.patch("time.monotonic", self.monotonic):
+            with mock.patch("time.sleep", self.sleep):
+                yield self
@@ -0,0 +1,107 @@
+from unittest import TestCase
+
+from .regex import compile, isregex, isregex_expr, strip_regex
+
+
+class Mismatch:
+    """
+    Mismatch represents a failed value comparison.
+
+    Mismatches evaluate as ``False``, so they can be returned by matchers
+    instead of raising an exception. The human friendly mismatch message,
+    which may include a values diff, is only rendered when needed.
+
+    Arguments:
+        expected (mixed): expected value or regular expression.
+        actual (mixed): actual value.
+        regex (bool): ``True`` if ``expected`` is a regular expression.
+        reason (str|function): optional mismatch message, or function
+            returning it. Replaces the default comparison message.
+    """
+
+    __slots__ = ("expected", "actual", "regex", "reason")
+
+    def __init__(self, expected=None, actual=None, regex=False, reason=None):
+        self.expected = expected
+        self.actual = actual
+        self.regex = regex
+        self.reason = reason
+
+    def __bool__(self):
+        return False
+
+    def __str__(self):
+        if self.reason is not None:
+            return self.reason() if callable(self.reason) else self.reason
+
+        # Rely on unittest assertions for pretty messages and diffs
+        test = TestCase()
+        test.maxDiff = None
+        try:
+            if self.regex:
+                test.assertRegex(self.actual, self.expected)
+            else:
+                test.assertEqual(self.expected, self.actual)
+        except AssertionError as err:
+            return str(err)
+        return f"{self.expected!r} != {self.actual!r}"
+
+    def __repr__(self):
+        return f"Mismatch({self})"
+
+
+def equal(x, y):
+    """
+    Compares two values by strict equality.
+
+    Arguments:
+        x (mixed): expected value.
+        y (mixed): actual value.
+
+    Returns:
+        bool|pook.comparator.Mismatch: ``True`` if both values are equal,
+            otherwise a mismatch.
+    """
+    return True if x == y else Mismatch(x, y)
+
+
+def matches(x, y, regex_expr=False):
+    """
+    Tries to match a regular expression value ``x`` against ``y``.
+
+    Arguments:
+        x (regex|str): regular expression to test.
+        y (str): value to match.
+        regex_expr (bool): enables regex string based expression matching.
+
+    Raises:
+        TypeError: if the regular expression and value types mismatch.
+
+    Returns:
+        bool|pook.comparator.Mismatch: ``True`` if the value matches,
+            otherwise a mismatch.
+    """
+    # Parse regex expression, if needed
+    x = strip_regex(x) if regex_expr and isregex_expr(x) else x
+
+    if isinstance(getattr(x, "pattern", None), str) and hasattr(y, "decode"):
+        y = y.decode("utf-8", "backslashreplace")
+
+    return True if compile(x).search(y) else Mismatch(x, y, regex=True)
+
+
+def test(x, y, regex_expr=False):
+    """
+    Compares to values based on regular expression matching or
+    strict equality comparison.
+
+    Arguments:
+        x (regex|str): string or regular expression to test.
+        y (str): value to match.
+        regex_expr (bool): enables regex string based expression matching.
+
+    Returns:
+        bool|pook.comparator.Mismatch: ``True`` if the values match,
+            otherwise a mismatch.
+    """
+    return matches(x, y, regex_expr=regex_expr) if isregex(x) else equal(x, y)
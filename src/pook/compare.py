@@ -1,6 +1,7 @@
 import re
 
-from .assertion import test
+from .comparator import test
+from .regex import compile as compile_regex
 
 # Negate is used a reserved token identifier to negate matching
 NEGATE = "!!"
@@ -8,7 +9,7 @@ NEGATE = "!!"
 
 def compile(expr):
     try:
-        return re.compile(expr, re.IGNORECASE)
+        return compile_regex(expr, re.IGNORECASE)
     except Exception:
         pass
 
@@ -24,20 +25,19 @@ def strip_negate(value):
     return value[len(NEGATE) :].lstrip()
 
 
-def compare(expr, value, regex_expr=False):
+def check(expr, value, regex_expr=False):
     """
-    Compares an string or regular expression againast a given value.
+    Compares an string or regular expression againast a given value,
+    without raising on mismatch.
 
     Arguments:
         expr (str|regex): string or regular expression value to compare.
         value (str): value to compare against to.
         regex_expr (bool, optional): enables string based regex matching.
 
-    Raises:
-        AssertionError: in case of assertion error.
-
     Returns:
-        bool
+        bool|pook.comparator.Mismatch: ``True`` if the values match,
+            otherwise a mismatch, which evaluates as ``False``.
     """
     # Strict equality comparison
     if expr == value:
@@ -51,11 +51,31 @@ def compare(expr, value, regex_expr=False):
 
     try:
         # RegExp or strict equality comparison
-        test(expr, value, regex_expr=regex_expr)
-    except Exception as err:
+        result = test(expr, value, regex_expr=regex_expr)
+    except Exception:
         if negate:
             return True
-        else:
-            raise err
+        raise
+
+    return True if negate else result
+
+
+def compare(expr, value, regex_expr=False):
+    """
+    Compares an string or regular expression againast a given value.
+
+    Arguments:
+        expr (str|regex): string or regular expression value to compare.
+        value (str): value to compare against to.
+        regex_expr (bool, optional): enables string based regex matching.
 
+    Raises:
+        AssertionError: in case of assertion error.
+
+    Returns:
+        bool
+    """
+    result = check(expr, value, regex_expr=regex_expr)
+    if not result:
+        raise AssertionError(result)
     return True
@@ -8,3 +8,6 @@ TYPES = {
     "form": "application/x-www-form-urlencoded",
     "form-data": "application/x-www-form-urlencoded",
 }
+
+# Default size in bytes of the chunks read from streamed response bodies
+CHUNK_SIZE = 64 * 1024
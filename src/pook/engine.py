@@ -1,10 +1,14 @@
+import threading
 from functools import partial
 from inspect import isfunction
 
+from .clock import Clock, VirtualClock
 from .exceptions import PookNoMatches
+from .index import MockIndex
 from .mock import Mock
 from .mock_engine import MockEngine
-from .regex import isregex
+from .regex import compile, isregex, strip_regex
+from .retention import RequestLog
 
 
 class Engine:
@@ -24,10 +28,14 @@ class Engine:
         mappers (list[function]): stores engine-level mock mapper functions.
         interceptors (list[pook.BaseInterceptor]): stores engine-level HTTP
             traffic interceptors.
-        unmatched_reqs (list[pook.Request]): stores engine-level unmatched
-            outgoing HTTP requests.
+        unmatched_reqs (pook.retention.RequestLog): stores engine-level
+            unmatched outgoing HTTP requests.
         network_filters (list[function]): stores engine-level real
             networking mode filters.
+        clock (pook.clock.Clock): clock used to simulate the mocks response
+            delays.
+        timeouts (bool): raises the HTTP client timeout errors when a mock
+            response delay exceeds the client timeout.
     """
 
     def __init__(self, network=False):
@@ -37,14 +45,31 @@ class Engine:
         self.active = False
         # Enables/Disables real networking
         self.networking = network
-        # Stores mocks
+        # Stores mocks. New mocks are appended and the list is replaced on
+        # any other change, so readers can iterate a copy without locking.
         self.mocks = []
+        # Guards the mocks registry writes
+        self._lock = threading.Lock()
+        # Stores the mocks routing index used for matching
+        self._index = MockIndex()
+        # Stores the pending mocks, in registration order
+        self._pending = {}
+        # Stores the done mocks
+        self._done = set()
         # Store engine-level global filters
         self.filters = []
         # Store engine-level global mappers
         self.mappers = []
+        # Stores the requests retention policy, see Engine.retain()
+        self._retention = None
+        # Stores the default mocks response delay in milliseconds
+        self._delay = 0
+        # Stores the clock used to simulate the response delays
+        self.clock = Clock()
+        # Enables/Disables the simulation of HTTP client timeouts
+        self.timeouts = False
         # Store unmatched requests.
-        self.unmatched_reqs = []
+        self.unmatched_reqs = RequestLog()
         # Store network filters used to determine when a request
         # should be filtered or not.
         self.network_filters = []
@@ -102,6 +127,9 @@ class Engine:
             return req.url.hostname == hostname
 
         for hostname in hostnames:
+            # Precompile regular expression hostnames
+            if isregex(hostname):
+                hostname = compile(strip_regex(hostname))
             self.use_network_filter(partial(hostname_filter, hostname))
 
         self.networking = True
@@ -164,7 +192,19 @@ class Engine:
         Arguments:
             mock (pook.Mock): mock instance to add.
         """
-        self.mocks.append(mock)
+        # Bind the mock to the engine, so it can notify expectation changes
+        if mock._engine is None:
+            mock._engine = self
+
+        # Apply the engine requests retention policy
+        if self._retention:
+            mock._calls.configure(**self._retention)
+
+        with self._lock:
+            self.mocks.append(mock)
+            self._index.add(mock)
+            self._pending[mock] = None
+            self._sync_mock(mock)
 
     def remove_mock(self, mock):
         """
@@ -173,13 +213,145 @@ class Engine:
         Arguments:
             mock (pook.Mock): mock instance to remove.
         """
-        self.mocks = [m for m in self.mocks if m is not mock]
+        with self._lock:
+            self.mocks = [m for m in self.mocks if m is not mock]
+            self._index.remove(mock)
+            self._pending.pop(mock, None)
+            self._done.discard(mock)
 
     def flush_mocks(self):
         """
         Flushes the current mocks.
         """
-        self.mocks = []
+        with self._lock:
+            self.mocks = []
+            self._index.flush()
+            self._pending = {}
+            self._done = set()
+
+    def update_mock(self, mock):
+        """
+        Updates an already registered mock whose request expectations,
+        TTL or done status have changed.
+
+        This method is called by ``pook.Mock`` itself, so you should not
+        need to call it manually.
+
+        Arguments:
+            mock (pook.Mock): mock instance to update.
+        """
+        with self._lock:
+            if mock in self._pending or mock in self._done:
+                self._index.update(mock)
+                self._sync_mock(mock)
+
+    def _sync_mock(self, mock):
+        """
+        Synchronizes the done status of a registered mock, retiring it from
+        matching if exhausted. Retired mocks are kept in ``Engine.mocks``,
+        and they are only evaluated again to report expiration errors in
+        debug mode.
+
+        Must be called holding the engine lock.
+
+        Arguments:
+            mock (pook.Mock): registered mock instance.
+        """
+        if mock.isdone():
+            self._pending.pop(mock, None)
+            self._done.add(mock)
+        elif mock in self._done:
+            self._done.discard(mock)
+            # Rebuild the pending mocks to keep them in registration order
+            pending = self._pending
+            self._pending = {
+                registered: None
+                for registered in self.mocks
+                if registered is mock or registered in pending
+            }
+
+        if mock._times <= 0:
+            self._index.retire(mock)
+        else:
+            self._index.restore(mock)
+
+    def retain(self, limit=None, sample=1, bodies=True):
+        """
+        Configures the retention policy of the requests matched by the
+        engine mocks and the unmatched requests, in order to bound memory
+        usage under sustained traffic.
+
+        Requests counters, such as ``Mock.calls`` or ``Engine.unmatched()``,
+        are always exact, regardless of the retained requests.
+
+        Arguments:
+            limit (int): maximum number of retained requests per mock and
+                for unmatched requests. Only the most recent ones are kept.
+                ``0`` only counts requests. Defaults to ``None``, which
+                means unbounded.
+            sample (int): retains one of every ``sample`` requests.
+                Defaults to ``1``.
+            bodies (bool): retains the request bodies. Defaults to ``True``.
+
+        Example::
+
+            # Only count requests
+            engine.retain(limit=0)
+
+            # Keep the last 100 requests, without bodies
+            engine.retain(limit=100, bodies=False)
+        """
+        self._retention = {"limit": limit, "sample": sample, "bodies": bodies}
+
+        self.unmatched_reqs.configure(**self._retention)
+        for mock in self.mocks:
+            mock._calls.configure(**self._retention)
+
+    def delay(self, delay=1000):
+        """
+        Sets the default network response delay of the engine mocks.
+
+        Mocks can override it via ``pook.Mock.delay()``.
+
+        Arguments:
+            delay (int): milliseconds to delay responses. ``0`` disables
+                the delay.
+        """
+        self._delay = int(delay)
+
+    def enable_virtual_clock(self, timeouts=False):
+        """
+        Enables the virtual clock mode, where the mocks response delays
+        advance a simulated clock instead of waiting.
+
+        ``asyncio`` loops running the intercepted requests are plugged into
+        the virtual time, so their timers, such as ``aiohttp`` timeouts,
+        expire natively. See ``pook.clock.VirtualClock`` for more
+        information.
+
+        Arguments:
+            timeouts (bool): raises the HTTP client timeout errors, such as
+                ``urllib3.exceptions.ReadTimeoutError`` or
+                ``httpx.ReadTimeout``, when a mock response delay exceeds
+                the client read timeout. Defaults to ``False``.
+
+        Returns:
+            pook.clock.VirtualClock: the virtual clock.
+        """
+        self.clock = VirtualClock()
+        self.timeouts = timeouts
+        return self.clock
+
+    def disable_virtual_clock(self):
+        """
+        Disables the virtual clock mode, waiting in real time for the mocks
+        response delays.
+
+        ``asyncio`` loops already plugged into the virtual time keep it, so
+        their time never goes backwards.
+        """
+        self.clock = Clock()
+        self.timeouts = False
 
     def _engine_proxy(self, method, *args, **kw):
         engine_method = getattr(self.mock_engine, method, None)
@@ -189,7 +361,7 @@ class Engine:
                 "current mock engine does not implements" f' required "{method}" method'
             )
 
-        return engine_method(self.mock_engine, *args, **kw)
+        return engine_method(*args, **kw)
 
     def add_interceptor(self, *interceptors):
         """
@@ -244,6 +416,10 @@ class Engine:
         if self.active:
             return None
 
+        # Compile the registered mocks ahead of matching
+        for mock in self.mocks:
+            mock.compile()
+
         # Activate mock engine
         self.mock_engine.activate()
         # Enable engine state
@@ -264,10 +440,17 @@ class Engine:
     def reset(self):
         """
         Resets and flushes engine state and mocks to defaults.
+
+        The requests retention policy is preserved.
         """
+        retention = self._retention
+
         # Reset engine
         Engine.__init__(self, network=self.networking)
 
+        if retention:
+            self.retain(**retention)
+
     def unmatched_requests(self):
         """
         Returns a ``tuple`` of unmatched requests.
@@ -278,7 +461,7 @@ class Engine:
         Returns:
             list: unmatched intercepted requests.
         """
-        return [mock for mock in self.unmatched_reqs]
+        return list(self.unmatched_reqs)
 
     def unmatched(self):
         """
@@ -290,7 +473,7 @@ class Engine:
         Returns:
             int: total number of unmatched requests.
         """
-        return len(self.unmatched_requests())
+        return self.unmatched_reqs.total
 
     def isunmatched(self):
         """
@@ -302,7 +485,7 @@ class Engine:
         Returns:
             bool
         """
-        return len(self.unmatched()) > 0
+        return self.unmatched() > 0
 
     def pending(self):
         """
@@ -311,7 +494,7 @@ class Engine:
         Returns:
             int: number of pending mocks.
         """
-        return len(self.pending_mocks())
+        return len(self._pending)
 
     def pending_mocks(self):
         """
@@ -320,7 +503,7 @@ class Engine:
         Returns:
             tuple: pending mock instances.
         """
-        return [mock for mock in self.mocks if not mock.isdone()]
+        return list(self._pending)
 
     def ispending(self):
         """
@@ -330,7 +513,7 @@ class Engine:
         Returns:
             bool
         """
-        return len(self.pending_mocks())
+        return len(self._pending)
 
     def isactive(self):
         """
@@ -348,7 +531,7 @@ class Engine:
         Returns:
             bool: True is all the registered mocks are gone, otherwise False.
         """
-        return all(mock.isdone() for mock in self.mocks)
+        return not self._pending
 
     def _append(self, target, *fns):
         (target.append(fn) for fn in fns if isfunction(fn))
@@ -420,15 +603,15 @@ class Engine:
             if not request:
                 raise ValueError("map function must return a request object")
 
-        # Store list of mock matching errors for further debugging
-        match_errors = []
+        # Store mock matching errors for further debugging
+        match_errors = {}
 
-        # Try to match the request against registered mock definitions
-        for mock in self.mocks[:]:
+        # Try to match the request against the candidate mock definitions
+        for mock in self._index.candidates(request):
             # Return the first matched HTTP request mock
-            matches, errors = mock.match(request.copy())
-            if len(errors):
-                match_errors += errors
+            matches, errors = mock._match(request.view())
+            if self.debug:
+                match_errors[mock] = errors
             if matches:
                 return mock
 
@@ -440,7 +623,8 @@ class Engine:
 
             # Compose unmatch error details, if debug mode is enabled
             if self.debug:
-                err = "\n\n".join([str(err) for err in match_errors])
+                errors = self._match_errors(request, match_errors)
+                err = "\n\n".join([str(err) for err in errors])
                 if err:
                     msg += f"\n\n=> Detailed matching errors:\n{err}\n"
 
@@ -450,6 +634,28 @@ class Engine:
         # Register unmatched request
         self.unmatched_reqs.append(request)
 
+    def _match_errors(self, request, match_errors):
+        """
+        Collects the matching errors of all the registered mocks, in
+        registration order, including the ones discarded by the routing index
+        and the retired exhausted mocks, which report their expiration.
+
+        Arguments:
+            request (pook.Request): unmatched request.
+            match_errors (dict): matching errors of the already evaluated mocks.
+
+        Returns:
+            list[pook.matcher.MatchError]: matching errors.
+        """
+        errors = []
+        for mock in self.mocks[:]:
+            if mock not in match_errors:
+                # Discarded mocks cannot match and retired mocks are
+                # expired, so this has no side effects
+                match_errors[mock] = mock._match(request.view())[1]
+            errors += match_errors[mock]
+        return errors
+
     def no_matches(self, msg):
         """Raise `PookNoMatches` and reduce pytest printed stacktrace noise"""
         raise PookNoMatches(msg)
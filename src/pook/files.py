@@ -0,0 +1,109 @@
+import mmap
+import os
+import threading
+import weakref
+
+from .constants import CHUNK_SIZE
+
+# Stores the shared mapped files by real path, while referenced by any mock
+_shared = weakref.WeakValueDictionary()
+_shared_lock = threading.Lock()
+
+
+class MappedFile:
+    """
+    MappedFile represents a disk file used as body, which is lazily
+    memory-mapped the first time its contents are needed.
+
+    Contents are exposed as zero-copy ``memoryview`` slices of the mapped
+    file, so declaring file backed mocks neither reads the file nor keeps a
+    copy of it in memory.
+
+    Relative paths are resolved against the current working directory when
+    the file is created.
+
+    Arguments:
+        path (str|os.PathLike): disk file path.
+
+    Raises:
+        OSError: if the file does not exist or cannot be accessed.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        # Report missing files when declared, instead of when matching
+        os.stat(self.path)
+        self._view = None
+        self._lock = threading.Lock()
+
+    def _map(self):
+        with open(self.path, "rb") as f:
+            # Empty files cannot be memory-mapped
+            if not os.fstat(f.fileno()).st_size:
+                return memoryview(b"")
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def view(self):
+        """
+        Returns the file contents, memory-mapping the file on first use.
+
+        Raises:
+            OSError: if the file cannot be opened.
+
+        Returns:
+            memoryview: read-only file contents.
+        """
+        view = self._view
+        if view is None:
+            with self._lock:
+                if self._view is None:
+                    self._view = self._map()
+                view = self._view
+        return view
+
+    def __iter__(self):
+        view = self.view()
+        for offset in range(0, len(view), CHUNK_SIZE):
+            yield view[offset : offset + CHUNK_SIZE]
+
+    def __eq__(self, other):
+        if isinstance(other, MappedFile):
+            return self.path == other.path
+        if isinstance(other, (bytes, bytearray, memoryview)):
+            return self.view() == other
+        return NotImplemented
+
+    __hash__ = object.__hash__
+
+    def __deepcopy__(self, memo):
+        # Mapped files are read-only, so they can be safely shared
+        return self
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path!r})"
+
+
+def mapfile(path, shared=False):
+    """
+    Creates a lazily memory-mapped file.
+
+    Arguments:
+        path (str|os.PathLike): disk file path.
+        shared (bool): reuses the same mapped file for every caller
+            referencing the same path. Defaults to ``False``.
+
+    Raises:
+        OSError: if the file does not exist or cannot be accessed.
+
+    Returns:
+        pook.files.MappedFile
+    """
+    if not shared:
+        return MappedFile(path)
+
+    key = os.path.realpath(path)
+    with _shared_lock:
+        file = _shared.get(key)
+        if file is None:
+            file = _shared[key] = MappedFile(key)
+        return file
@@ -0,0 +1,250 @@
+from bisect import insort
+from heapq import merge
+from itertools import islice
+
+from .compare import NEGATE
+from .matchers import MethodMatcher, URLMatcher
+
+
+def route(mock):
+    """
+    Infers the routing key of the given mock based on its method and URL
+    matchers expectations.
+
+    Arguments:
+        mock (pook.Mock): mock instance to route.
+
+    Returns:
+        tuple|None: ``(method, scheme, hostname, port)`` routing key, where
+            ``method`` and ``port`` can be ``None`` if the mock matches any
+            of them. ``None`` if the mock cannot be routed.
+    """
+    # Request mappers may rewrite the request before matching
+    if mock.mappers:
+        return None
+
+    method, url = None, None
+    for matcher in mock.matchers:
+        if matcher.negate:
+            continue
+        if isinstance(matcher, MethodMatcher):
+            expectation = matcher.expectation
+            if isinstance(expectation, str) and expectation != "*":
+                method = expectation.lower()
+        elif isinstance(matcher, URLMatcher) and not matcher.regex:
+            url = matcher.expectation
+
+    if url is None or not url.hostname or url.hostname.startswith(NEGATE):
+        return None
+
+    try:
+        port = url.port
+    except ValueError:
+        return None
+
+    return method, url.scheme, url.hostname, port
+
+
+def request_keys(request):
+    """
+    Returns the routing keys an outgoing request can be dispatched to.
+
+    Arguments:
+        request (pook.Request): outgoing request.
+
+    Returns:
+        list[tuple]: routing keys.
+    """
+    url = request.url
+    try:
+        scheme, hostname, port = url.scheme, url.hostname, url.port
+    except (AttributeError, ValueError):
+        return []
+
+    method = request.method.lower() if isinstance(request.method, str) else None
+    methods = (method, None) if method else (None,)
+    ports = (port, None) if port is not None else (None,)
+
+    return [(m, scheme, hostname, p) for m in methods for p in ports]
+
+
+class MockIndex:
+    """
+    MockIndex implements the mock routing index used by ``pook.Engine``
+    in order to only evaluate the mocks that can potentially match an
+    outgoing HTTP request, instead of scanning every registered mock.
+
+    Mocks are indexed by method, scheme, hostname and port. Mocks that
+    cannot be routed, such as regular expression based URLs or mocks with
+    request mappers, are stored in a fallback bucket that is evaluated for
+    every request.
+
+    Indexed mocks can be retired, such as exhausted mocks, so they are no
+    longer candidates until they are restored, keeping their registration
+    order.
+
+    Buckets are append-only: registered mocks are appended in place, and
+    any other change publishes a new bucket. Readers only iterate the
+    bucket items present when routing the request, so they never lock and
+    can safely iterate the candidates while mocks are registered or
+    removed, even on free-threaded Python builds. Writes must be
+    serialized by the caller, see ``pook.Engine``.
+    """
+
+    def __init__(self):
+        # Stores the registration sequence counter
+        self._seq = 0
+        # Stores the routing key and sequence of every indexed mock
+        self._entries = {}
+        # Stores routed mocks by routing key
+        self._routes = {}
+        # Stores the mocks that cannot be routed
+        self._fallback = []
+        # Stores the retired mocks, which are not candidates
+        self._retired = set()
+
+    def __len__(self):
+        return len(self._entries) - len(self._retired)
+
+    def __contains__(self, mock):
+        return mock in self._entries and mock not in self._retired
+
+    def _bucket(self, key):
+        return self._fallback if key is None else self._routes.get(key, [])
+
+    def _publish(self, key, bucket):
+        if key is None:
+            self._fallback = bucket
+        elif bucket:
+            self._routes[key] = bucket
+        else:
+            self._routes.pop(key, None)
+
+    def _append(self, key, entry):
+        # Entries are registered in sequence order, so appending keeps the
+        # buckets sorted without copying them
+        if key is None:
+            self._fallback.append(entry)
+        else:
+            self._routes.setdefault(key, []).append(entry)
+
+    def _insert(self, key, entry):
+        bucket = list(self._bucket(key))
+        insort(bucket, entry, key=lambda entry: entry[0])
+        self._publish(key, bucket)
+
+    def _delete(self, key, entry):
+        bucket = [e for e in self._bucket(key) if e is not entry]
+        self._publish(key, bucket)
+
+    def add(self, mock):
+        """
+        Indexes the given mock, preserving the registration order.
+
+        Arguments:
+            mock (pook.Mock): mock instance to index.
+        """
+        if mock in self._entries:
+            return
+
+        self._seq += 1
+        key, entry = route(mock), (self._seq, mock)
+        self._entries[mock] = (key, entry)
+        self._append(key, entry)
+
+    def remove(self, mock):
+        """
+        Removes the given mock from the index, if present.
+
+        Arguments:
+            mock (pook.Mock): mock instance to remove.
+        """
+        key, entry = self._entries.pop(mock, (None, None))
+        if mock in self._retired:
+            self._retired.discard(mock)
+        elif entry:
+            self._delete(key, entry)
+
+    def retire(self, mock):
+        """
+        Retires an indexed mock, so it is no longer a matching candidate.
+
+        Arguments:
+            mock (pook.Mock): mock instance to retire.
+        """
+        if mock not in self:
+            return
+
+        key, entry = self._entries[mock]
+        self._retired.add(mock)
+        self._delete(key, entry)
+
+    def restore(self, mock):
+        """
+        Restores a retired mock as a matching candidate, preserving its
+        registration order.
+
+        Arguments:
+            mock (pook.Mock): mock instance to restore.
+        """
+        if mock not in self._retired:
+            return
+
+        key, entry = self._entries[mock]
+        self._retired.discard(mock)
+        self._insert(key, entry)
+
+    def update(self, mock):
+        """
+        Re-routes an already indexed mock whose expectations have changed.
+
+        Arguments:
+            mock (pook.Mock): mock instance to re-route.
+        """
+        if mock not in self._entries:
+            return
+
+        key, entry = self._entries[mock]
+        new_key = route(mock)
+        if new_key == key:
+            return
+
+        self._entries[mock] = (new_key, entry)
+        if mock not in self._retired:
+            self._delete(key, entry)
+            self._insert(new_key, entry)
+
+    def flush(self):
+        """
+        Flushes all the indexed mocks.
+        """
+        self._entries = {}
+        self._routes = {}
+        self._fallback = []
+        self._retired = set()
+
+    def candidates(self, request):
+        """
+        Returns the mocks that may match the given request, in registration
+        order.
+
+        Arguments:
+            request (pook.Request): outgoing request to route.
+
+        Returns:
+            iterable[pook.Mock]: candidate mocks.
+        """
+        routes = self._routes
+        buckets = [routes.get(key) for key in request_keys(request)]
+        buckets = [bucket for bucket in buckets if bucket]
+        if self._fallback:
+            buckets.append(self._fallback)
+
+        # Ignore the mocks registered while iterating the candidates
+        buckets = [islice(bucket, len(bucket)) for bucket in buckets]
+
+        if not buckets:
+            return ()
+        if len(buckets) == 1:
+            return (mock for _, mock in buckets[0])
+        return (mock for _, mock in merge(*buckets, key=lambda entry: entry[0]))
@@ -1,4 +1,3 @@
-import asyncio
 from http.client import responses as http_reasons
 from unittest import mock
 import typing as t
@@ -77,13 +76,22 @@ class MockedTransport(httpx.BaseTransport, t.Generic[T]):
 
         return req
 
+    def _get_timeout(self, httpx_request: httpx.Request) -> t.Optional[float]:
+        return httpx_request.extensions.get("timeout", {}).get("read")
+
+    def _get_content(self, mock_response: Response) -> t.Any:
+        body = mock_response._body
+        if isinstance(body, list) or mock_response.stream:
+            return mock_response.iter_body()
+        return body
+
     def _get_httpx_response(
         self, httpx_request: httpx.Request, mock_response: Response
     ) -> httpx.Response:
         res = httpx.Response(
             status_code=mock_response._status,
             headers=mock_response._headers,
-            content=mock_response._body,
+            content=self._get_content(mock_response),
             extensions={
                 # TODO: Add HTTP2 response support
                 "http_version": b"HTTP/1.1",
@@ -105,6 +113,12 @@ class MockedTransport(httpx.BaseTransport, t.Generic[T]):
 
 
 class AsyncTransport(MockedTransport[httpx.AsyncBaseTransport]):
+    def _get_content(self, mock_response):
+        body = mock_response._body
+        if isinstance(body, list) or mock_response.stream:
+            return mock_response.aiter_body()
+        return body
+
     async def _get_pook_request(self, httpx_request):
         req = super()._get_pook_request(httpx_request)
         req.body = await httpx_request.aread()
@@ -119,8 +133,10 @@ class AsyncTransport(MockedTransport[httpx.AsyncBaseTransport]):
             transport = self._original_transport_for_url(self._client, request.url)
             return await transport.handle_async_request(request)
 
-        if mock._delay:
-            await asyncio.sleep(mock._delay / 1000)
+        try:
+            await self._interceptor.asleep(mock, timeout=self._get_timeout(request))
+        except TimeoutError:
+            raise httpx.ReadTimeout("timed out", request=request) from None
 
         return self._get_httpx_response(request, mock._response)
 
@@ -140,4 +156,9 @@ class SyncTransport(MockedTransport[httpx.BaseTransport]):
             transport = self._original_transport_for_url(self._client, request.url)
             return transport.handle_request(request)
 
+        try:
+            self._interceptor.sleep(mock, timeout=self._get_timeout(request))
+        except TimeoutError:
+            raise httpx.ReadTimeout("timed out", request=request) from None
+
         return self._get_httpx_response(request, mock._response)
@@ -1,3 +1,4 @@
+import asyncio
 from http.client import responses as http_reasons
 from typing import Optional
 from unittest import mock
@@ -8,6 +9,7 @@ from aiohttp.helpers import TimerNoop
 from aiohttp.streams import EmptyStreamReader
 
 from pook.request import Request  # type: ignore
+from pook.stream import CHUNK_SIZE  # type: ignore
 from pook.interceptors.base import BaseInterceptor
 
 # Try to load yarl URL parser package used by aiohttp
@@ -38,6 +40,8 @@ class AIOHTTPInterceptor(BaseInterceptor):
         if not mock:
             return await handler(request)
 
+        await self.asleep(mock)
+
         # Shortcut to mock response
         res = mock._response
 
@@ -60,8 +64,9 @@ class AIOHTTPInterceptor(BaseInterceptor):
         )
         _res._headers = multidict.CIMultiDictProxy(multidict.CIMultiDict(headers))
 
-        if res._body:
-            _res.content = SimpleContent(res._body)
+        if res._body or res.stream:
+            # Incrementally feed the response stream from the body chunks
+            _res.content = BodyStreamReader(res.aiter_body())
         else:
             # Define `_content` attribute with an empty string to
             # force do not read from stream (which won't exists)
@@ -106,13 +111,63 @@ class AIOHTTPInterceptor(BaseInterceptor):
             patch.stop()
 
 
-class SimpleContent(EmptyStreamReader):
-    def __init__(self, content, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.content = content
+class StreamProtocol:
+    """
+    Flow control protocol of the mocked response streams, used to pause
+    feeding the response body while the stream buffer is full.
+    """
+
+    connected = True
+
+    def __init__(self):
+        self._reading_paused = False
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+
+    def pause_reading(self):
+        self._reading_paused = True
+        self._resumed.clear()
+
+    def resume_reading(self):
+        self._reading_paused = False
+        self._resumed.set()
+
+    async def wait_resumed(self):
+        await self._resumed.wait()
 
-    async def read(self, n=-1):
-        return self.content
+
+class BodyStreamReader(aiohttp.StreamReader):
+    """
+    aiohttp stream reader incrementally fed from the mock response body
+    chunks by a background task, honouring the stream backpressure.
+
+    Arguments:
+        chunks (async iterator[bytes]): response body chunks.
+        limit (int): stream buffer size limit in bytes.
+    """
+
+    def __init__(self, chunks, limit=CHUNK_SIZE):
+        loop = asyncio.get_running_loop()
+        super().__init__(StreamProtocol(), limit, loop=loop)
+        self._feeder = loop.create_task(self._feed(chunks))
+
+    async def _feed(self, chunks):
+        try:
+            async for chunk in chunks:
+                await self._protocol.wait_resumed()  # type: ignore[attr-defined]
+                # Stream consumers expect bytes, not memoryview slices
+                self.feed_data(chunk if type(chunk) is bytes else bytes(chunk))
+        except Exception as err:
+            super().set_exception(err)
+        else:
+            self.feed_eof()
+        finally:
+            await chunks.aclose()
+
+    def set_exception(self, *args, **kw):
+        # Stop feeding the body once the response is released
+        self._feeder.cancel()
+        super().set_exception(*args, **kw)
 
 
 def HTTPResponse(session: aiohttp.ClientSession, *args, **kw):
@@ -35,3 +35,66 @@ class BaseInterceptor:
         This method must be implemented by any interceptor.
         """
         raise NotImplementedError("Sub-classes must implement `disable`")
+
+    def delay(self, mock):
+        """
+        Returns the network response delay of the given mock in seconds,
+        which defaults to the delay of the engine the mock belongs to.
+
+        Arguments:
+            mock (pook.Mock): matched mock.
+
+        Returns:
+            float
+        """
+        delay = mock._delay
+        if delay is None:
+            delay = (mock._engine or self.engine)._delay
+        return delay / 1000
+
+    def _wait(self, mock, timeout):
+        engine = mock._engine or self.engine
+        delay = self.delay(mock)
+
+        # Wait until the client times out, if it happens before the response
+        if engine.timeouts and timeout is not None and delay > timeout:
+            return engine.clock, timeout, True
+        return engine.clock, delay, False
+
+    def sleep(self, mock, timeout=None):
+        """
+        Blocks the current thread during the mock response delay, if any,
+        according to the engine clock.
+
+        Arguments:
+            mock (pook.Mock): matched mock.
+            timeout (float): client read timeout in seconds, if any.
+
+        Raises:
+            TimeoutError: if the engine simulates client timeouts and the
+                delay exceeds the client timeout.
+        """
+        clock, delay, timed_out = self._wait(mock, timeout)
+        if delay:
+            clock.sleep(delay)
+        if timed_out:
+            raise TimeoutError("timed out")
+
+    async def asleep(self, mock, timeout=None):
+        """
+        Asynchronously sleeps during the mock response delay, if any,
+        according to the engine clock, without blocking the event loop.
+
+        Arguments:
+            mock (pook.Mock): matched mock.
+            timeout (float): client read timeout in seconds, if any.
+
+        Raises:
+            TimeoutError: if the engine simulates client timeouts and the
+                delay exceeds the client timeout.
+        """
+        clock, delay, timed_out = self._wait(mock, timeout)
+        if delay:
+            await clock.asleep(delay)
+        if timed_out:
+            raise TimeoutError("timed out")
@@ -1,3 +1,4 @@
+import io
 import socket
 from http.client import _CS_REQ_SENT, HTTPMessage  # type: ignore[attr-defined]
 from http.client import HTTPSConnection
@@ -8,6 +9,7 @@ from http.client import (
 from unittest import mock
 
 from pook.request import Request  # type: ignore
+from pook.stream import BodyReader  # type: ignore
 from pook.interceptors.base import BaseInterceptor
 
 PATCHES = ("http.client.HTTPConnection.request",)
@@ -76,12 +78,24 @@ class HTTPClientInterceptor(BaseInterceptor):
         mockres.code = res._status
         mockres.reason = http_reasons.get(res._status)
         mockres.headers = HTTPMessage()
-        mockres.length = len(res._body or b"")
+        mockres.chunked = False
+        mockres.will_close = True
+        mockres.length = (
+            None if res.stream or isinstance(res._body, list) else len(res._body or b"")
+        )
+
+        # Buffered file-like body, lazily reading the body chunks
+        mockres.fp = io.BufferedReader(BodyReader(res.iter_body()))
 
         for hkey, hval in res._headers.itermerged():
             mockres.headers.add_header(hkey, hval)
 
         def getresponse():
+            # Real responses are awaited here, so simulate delays and read
+            # timeouts here too. Connections without explicit timeout use a
+            # sentinel object.
+            timeout = conn.timeout if isinstance(conn.timeout, (int, float)) else None
+            self.sleep(mock, timeout=timeout)
             return mockres
 
         conn.getresponse = getresponse
@@ -89,12 +103,6 @@ class HTTPClientInterceptor(BaseInterceptor):
         conn.__response = mockres  # type: ignore[attr-defined]
         conn.__state = _CS_REQ_SENT  # type: ignore[attr-defined]
 
-        # Path reader
-        def read():
-            return res._body or b""
-
-        mockres.read = read
-
         return mockres
 
     def _patch(self, path):
@@ -1,4 +1,6 @@
 import io
+import re
+import socket
 from http.client import (
     HTTPResponse as ClientHTTPResponse,
 )
@@ -8,6 +10,7 @@ from http.client import (
 from unittest import mock
 
 from pook.request import Request  # type: ignore
+from pook.stream import BodyReader  # type: ignore
 from pook.interceptors.base import BaseInterceptor
 from pook.interceptors.http import URLLIB3_BYPASS
 
@@ -18,6 +21,8 @@ PATCHES = (
 
 RESPONSE_CLASS = "HTTPResponse"
 
+_NEWLINE = re.compile(b"\n")
+
 RESPONSE_PATH = {
     "requests": "requests.packages.urllib3.response",
     "urllib3": "urllib3.response",
@@ -38,6 +43,21 @@ def HTTPResponse(path, *args, **kw):
     return HTTPResponse(*args, **kw)
 
 
+def read_timeout(pool, kw):
+    # Resolve the request timeout as urllib3 does, defaulting to the pool one
+    timeout = pool._get_timeout(kw["timeout"]) if "timeout" in kw else pool.timeout
+
+    # Timeout.read_timeout requires a started connect timer when a total
+    # timeout is set, so resolve it from the configured values instead,
+    # since mocked requests do not connect
+    read, total = timeout._read, timeout.total
+    if read is timeout.DEFAULT_TIMEOUT:
+        read = total if total is not None else socket.getdefaulttimeout()
+    elif read is None or total is not None and total < read:
+        read = total
+    return read
+
+
 def is_chunked_response(headers):
     tencoding = dict(headers).get("Transfer-Encoding", "").lower()
     return "chunked" in tencoding.split(",")
@@ -71,40 +91,86 @@ class FakeResponse:
 
 
 class FakeChunkedResponseBody:
-    def __init__(self, chunks):
-        # append a terminating chunk
-        chunks.append(b"")
+    """
+    File-like chunked transfer encoded response body, lazily encoding the
+    body chunks as they are read.
 
-        self.position = 0
-        self.stream = b"".join([self._encode(c) for c in chunks])
+    Reads are served from ``memoryview`` slices of the chunks, so the body
+    is never joined in memory.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._frames = self._encode(chunks)
+        self._frame = memoryview(b"")
         self.closed = False
 
-    def _encode(self, chunk):
-        length = "%X\r\n" % len(chunk)
-        return length.encode() + chunk + b"\r\n"
+    @staticmethod
+    def _encode(chunks):
+        for chunk in chunks:
+            # Empty chunks would prematurely terminate the body
+            if chunk:
+                yield b"%X\r\n" % len(chunk)
+                yield chunk
+                yield b"\r\n"
 
-    def read_chunk(self, amt=-1, whole=False):
-        if whole or amt == -1:
-            end_idx = self.stream.index(b"\r\n", self.position) + 2
-        else:
-            end_idx = self.position + amt
+        # Terminating chunk
+        yield b"0\r\n\r\n"
 
-        chunk = self.stream[self.position : end_idx]
-        self.position = end_idx
+    def _next_frame(self):
+        frame = next(self._frames, None)
+        if frame is None:
+            return False
 
-        return chunk
+        self._frame = memoryview(frame).cast("B")
+        return True
 
-    def readline(self):
-        return self.read_chunk(whole=True)
+    def _take(self, size):
+        frame = self._frame
+        self._frame = frame[size:]
+
+        # Return whole bytes frames as is, avoiding copies
+        obj = frame.obj
+        if type(obj) is bytes and len(obj) == len(frame) <= size:
+            return obj
+        return frame[:size].tobytes()
 
     def read(self, amt=-1):
-        return self.read_chunk(amt)
+        if amt is None or amt < 0:
+            frames = [self._frame, *self._frames]
+            self._frame = memoryview(b"")
+            return b"".join(frames)
+
+        data = []
+        while amt > 0 and (self._frame or self._next_frame()):
+            chunk = self._take(amt)
+            amt -= len(chunk)
+            data.append(chunk)
+
+        return data[0] if len(data) == 1 else b"".join(data)
+
+    def readline(self):
+        data = []
+        while self._frame or self._next_frame():
+            newline = _NEWLINE.search(self._frame)
+            size = newline.end() if newline else len(self._frame)
+            data.append(self._take(size))
+            if newline:
+                break
+
+        return b"".join(data)
 
     def flush(self):
         pass
 
     def close(self):
         self.closed = True
+        self._frames.close()
+
+        # Release the body stream source, such as generators
+        close = getattr(self._chunks, "close", None)
+        if close:
+            close()
 
 
 class Urllib3Interceptor(BaseInterceptor):
@@ -136,6 +202,20 @@ class Urllib3Interceptor(BaseInterceptor):
         if not mock:
             return urlopen(pool, method, url, body=body, headers=headers, **kw)
 
+        # Only resolve the client timeout if it can be simulated
+        engine = mock._engine or self.engine
+        timeout = (
+            read_timeout(pool, kw) if engine.timeouts and self.delay(mock) else None
+        )
+        try:
+            self.sleep(mock, timeout=timeout)
+        except TimeoutError:
+            from urllib3.exceptions import ReadTimeoutError
+
+            raise ReadTimeoutError(
+                pool, url, f"Read timed out. (read timeout={timeout})"
+            ) from None
+
         # Shortcut to mock response and response body
         res = mock._response
         body = res._body
@@ -146,10 +226,11 @@ class Urllib3Interceptor(BaseInterceptor):
             headers.append((key, res._headers[key]))
 
         if is_chunked_response(headers):
-            body_chunks = body if isinstance(body, list) else [body]
-
             body = ClientHTTPResponse(MockSock)  # type: ignore
-            body.fp = FakeChunkedResponseBody(body_chunks)  # type:ignore
+            body.fp = FakeChunkedResponseBody(res.iter_body())  # type:ignore
+        elif res.stream:
+            # Lazily read the body stream source
+            body = io.BufferedReader(BodyReader(res.iter_body()))
         else:
             # Assume that the body is a bytes-like object
             body = io.BytesIO(res._body)
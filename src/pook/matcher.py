@@ -1,9 +1,146 @@
+from .comparator import Mismatch
+from .matchers.base import BaseMatcher
+
+# Default cost of the matchers not defining it
+DEFAULT_COST = 50
+
+
+def matcher_cost(matcher):
+    """
+    Returns the estimated matching cost of the given matcher.
+
+    Arguments:
+        matcher (pook.matchers.BaseMatcher): matcher instance.
+
+    Returns:
+        int
+    """
+    return getattr(matcher, "cost", DEFAULT_COST)
+
+
+def compile_matcher(matcher):
+    """
+    Compiles the given matcher into a predicate function.
+
+    Custom matchers not inheriting from ``pook.matchers.BaseMatcher`` use
+    their ``match()`` method.
+
+    Arguments:
+        matcher (pook.matchers.BaseMatcher): matcher instance.
+
+    Returns:
+        function: matcher predicate function.
+    """
+    if isinstance(matcher, BaseMatcher):
+        return matcher.compile()
+    return matcher.match
+
+
+def _mutator(name):
+    method = getattr(list, name)
+
+    def mutate(self, *args):
+        result = method(self, *args)
+        self._changed()
+        return result
+
+    mutate.__name__ = name
+    mutate.__doc__ = method.__doc__
+    return mutate
+
+
+class MatchError:
+    """
+    MatchError stores a matching error record, whose human friendly message
+    is only rendered when it is actually needed, such as when no mock
+    matches an outgoing request.
+
+    Arguments:
+        reason (Exception|function): matching error, or function returning
+            the error message.
+        matcher (pook.matchers.BaseMatcher, optional): failed matcher.
+    """
+
+    __slots__ = ("reason", "matcher")
+
+    def __init__(self, reason, matcher=None):
+        self.reason = reason
+        self.matcher = matcher
+
+    def __str__(self):
+        reason = self.reason
+        if not isinstance(reason, BaseException) and callable(reason):
+            reason = reason()
+        if self.matcher is None:
+            return str(reason)
+        return f"{type(self.matcher).__name__}: {reason}"
+
+    def __repr__(self):
+        return f"MatchError({self})"
+
+
 class MatcherEngine(list):
     """
     HTTP request matcher engine used by `pook.Mock` to test if an
     intercepted outgoing HTTP request must be mocked out or not.
+
+    Matchers are evaluated by estimated cost, cheaper first, based on the
+    matcher ``cost`` attribute, and the evaluation stops at the first
+    failed matcher.
+
+    Any change to the matchers list, such as ``engine[0] = matcher``,
+    invalidates the compiled matchers and notifies ``on_change``.
+
+    Attributes:
+        ordered (bool): evaluates matchers by cost. If ``False``, matchers
+            are evaluated in declaration order. Defaults to ``True``.
+        collect_errors (bool): evaluates all the matchers, even after a
+            failure, in order to collect every matching error. Useful for
+            debugging. Defaults to ``False``.
+        on_change (function): function called without arguments every time
+            the matchers change. Defaults to ``None``.
     """
 
+    # Evaluate all the matchers, collecting every matching error
+    collect_errors = False
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        # Evaluate matchers by estimated cost
+        self._ordered = True
+        # Stores the compiled matchers
+        self._compiled = None
+        # Stores the function notified when the matchers change
+        self.on_change = None
+
+    @property
+    def ordered(self):
+        return self._ordered
+
+    @ordered.setter
+    def ordered(self, ordered):
+        self._ordered = ordered
+        # Recompile the matchers in the new evaluation order
+        self._compiled = None
+
+    def _changed(self):
+        self._compiled = None
+        if self.on_change is not None:
+            self.on_change()
+
+    append = _mutator("append")
+    extend = _mutator("extend")
+    insert = _mutator("insert")
+    remove = _mutator("remove")
+    pop = _mutator("pop")
+    clear = _mutator("clear")
+    sort = _mutator("sort")
+    reverse = _mutator("reverse")
+    __setitem__ = _mutator("__setitem__")
+    __delitem__ = _mutator("__delitem__")
+    __iadd__ = _mutator("__iadd__")
+    __imul__ = _mutator("__imul__")
+
     def add(self, matcher):
         """
         Adds a new matcher function to the current engine.
@@ -20,6 +157,23 @@ class MatcherEngine(list):
         """
         self.clear()
 
+    def compile(self):
+        """
+        Compiles the registered matchers into predicate functions, sorted by
+        estimated cost if ``ordered`` is enabled.
+
+        Compilation happens automatically on first match, and it is
+        invalidated every time the matchers or the evaluation order change.
+
+        Returns:
+            tuple(tuple(matcher, function)): compiled matchers.
+        """
+        matchers = sorted(self, key=matcher_cost) if self.ordered else self
+        # Compiled matchers are immutable, so they can be shared by threads
+        compiled = tuple((matcher, compile_matcher(matcher)) for matcher in matchers)
+        self._compiled = compiled
+        return compiled
+
     def match(self, request):
         """
         Match the given HTTP request instance against the registered
@@ -33,17 +187,34 @@ class MatcherEngine(list):
                 passes, otherwise ``False``. Also returns an optional list
                 of error exceptions.
         """
-        errors = []
+        matches, errors = self._match(request)
+        return matches, [str(error) for error in errors]
+
+    def _match(self, request):
+        """
+        Same as ``MatcherEngine.match()``, but matching errors are returned
+        as ``pook.matcher.MatchError`` records, rendered only if needed.
+        """
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self.compile()
 
-        def match(matcher):
+        matches, errors = True, []
+        for matcher, match in compiled:
             try:
-                return matcher.match(request)
+                result = match(request)
+                if result:
+                    continue
+                if isinstance(result, Mismatch):
+                    errors.append(MatchError(result, matcher))
             except Exception as err:
-                err = f"{type(matcher).__name__}: {err}"
-                errors.append(err)
-                return False
+                errors.append(MatchError(err, matcher))
+
+            if not self.collect_errors:
+                return False, errors
+            matches = False
 
-        return all([match(matcher) for matcher in self]), errors
+        return matches, errors
 
     def __repr__(self):
         """
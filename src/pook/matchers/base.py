@@ -2,7 +2,8 @@ import functools
 from abc import ABCMeta, abstractmethod
 from copy import deepcopy
 
-from ..compare import compare
+from ..comparator import Mismatch
+from ..compare import check, compare
 
 
 class BaseMatcher:
@@ -15,6 +16,9 @@ class BaseMatcher:
     # Negate matching if necessary
     negate = False
 
+    # Estimated matching cost. Cheaper matchers are evaluated first.
+    cost = 50
+
     def __init__(self, expectation, negate=False):
         if not expectation:
             raise ValueError("expectation argument cannot be empty")
@@ -44,6 +48,26 @@ class BaseMatcher:
             request (pook.Request): request object to match.
         """
 
+    def compile(self):
+        """
+        Compiles the matcher into a predicate function that receives the
+        ``pook.Request`` to match, used by ``pook.MatcherEngine``.
+
+        Negation is decided at compile time. Matchers can override this
+        method in order to precompute their expectations.
+
+        Returns:
+            function: matcher predicate function.
+        """
+        match = getattr(type(self).match, "_match", None)
+        if match is None:
+            return self.match
+
+        match = match.__get__(self)
+        if self.negate:
+            return lambda request: not match(request)
+        return match
+
     def compare(self, value, expectation, regex_expr=False):
         """
         Compares two values with regular expression matching support.
@@ -58,6 +82,22 @@ class BaseMatcher:
         """
         return compare(value, expectation, regex_expr=regex_expr)
 
+    def check(self, value, expectation, regex_expr=False):
+        """
+        Compares two values with regular expression matching support,
+        without raising on mismatch.
+
+        Arguments:
+            value (mixed): value to compare.
+            expectation (mixed): value to match.
+            regex_expr (bool, optional): enables string based regex matching.
+
+        Returns:
+            bool|pook.comparator.Mismatch: ``True`` if the values match,
+                otherwise a mismatch, which evaluates as ``False``.
+        """
+        return check(value, expectation, regex_expr=regex_expr)
+
     def to_dict(self):
         """
         Returns the current matcher representation as dictionary.
@@ -80,6 +120,8 @@ class BaseMatcher:
             result = fn(self, *args)
             return not result if self.negate else result
 
+        # Expose the undecorated match function for matcher compilation
+        wrapper._match = fn
         return wrapper
 
 
@@ -88,6 +130,8 @@ class ExistsMatcher(BaseMatcher, metaclass=ABCMeta):
     Base class for matchers that only check for existence.
     """
 
+    cost = 30
+
     @property
     @abstractmethod
     def request_attr(self):
@@ -108,12 +152,14 @@ class ExistsMatcher(BaseMatcher, metaclass=ABCMeta):
     @BaseMatcher.matcher
     def match(self, request):
         attribute = self.get_request_attribute(request)
-        assert (
-            attribute is not None
-        ), f"Expected request to have {self.request_attr} with {self.expectation}, but no {self.request_attr} found on the request"
-
-        assert (
-            self.expectation in attribute
-        ), f"{self.expectation} not found in request's {self.request_attr}"
+        if attribute is None:
+            return Mismatch(
+                reason=lambda: f"Expected request to have {self.request_attr} with {self.expectation}, but no {self.request_attr} found on the request"
+            )
+
+        if self.expectation not in attribute:
+            return Mismatch(
+                reason=lambda: f"{self.expectation} not found in request's {self.request_attr}"
+            )
 
         return True
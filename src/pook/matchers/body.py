@@ -1,3 +1,4 @@
+from ..regex import compile, isregex_expr, strip_regex
 from .base import BaseMatcher
 
 
@@ -7,6 +8,18 @@ class BodyMatcher(BaseMatcher):
     regular expression based matching.
     """
 
+    cost = 40
+
+    def __init__(self, body):
+        BaseMatcher.__init__(self, body)
+        self.expectation = body
+
+    @BaseMatcher.expectation.setter
+    def expectation(self, body):
+        self._expectation = body
+        # Precompile regular expression strings once
+        self._body = compile(strip_regex(body)) if isregex_expr(body) else body
+
     @BaseMatcher.matcher
     def match(self, req):
-        return self.compare(self.expectation, req.body)
+        return self.check(self._body, req.body)
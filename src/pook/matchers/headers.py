@@ -1,5 +1,6 @@
+from ..comparator import Mismatch
 from ..headers import to_string_value
-from ..regex import Pattern
+from ..regex import Pattern, compile, isregex_expr, strip_regex
 from .base import BaseMatcher, ExistsMatcher
 
 
@@ -8,31 +9,41 @@ class HeadersMatcher(BaseMatcher):
     Headers HTTP request matcher.
     """
 
+    cost = 30
+
     def __init__(self, headers):
         if not isinstance(headers, dict):
             raise TypeError("headers must be a dictionary")
         BaseMatcher.__init__(self, headers)
+        self.expectation = headers
+
+    @BaseMatcher.expectation.setter
+    def expectation(self, headers):
+        self._expectation = headers
+        # Precompute comparable header values, compiling regex expressions
+        self._values = tuple(
+            (key, self.to_comparable_value(value)) for key, value in headers.items()
+        )
 
     @BaseMatcher.matcher
     def match(self, req):
-        for key in self.expectation:
-            assert key in req.headers, f"Header '{key}' not present"
-
-            expected_value = self.to_comparable_value(self.expectation[key])
+        for key, expected_value in self._values:
+            if key not in req.headers:
+                return Mismatch(reason=lambda: f"Header '{key}' not present")
 
             # Retrieve header value by key
             actual_value = req.headers.get(key)
 
-            assert not all(
-                [
-                    expected_value is not None,
-                    actual_value is None,
-                ]
-            ), f"Expected a value `{expected_value}` " f"for '{key}' but found `None`"
+            if expected_value is not None and actual_value is None:
+                return Mismatch(
+                    reason=lambda: f"Expected a value `{expected_value}` "
+                    f"for '{key}' but found `None`"
+                )
 
             # Compare header value
-            if not self.compare(expected_value, actual_value, regex_expr=True):
-                return False
+            result = self.check(expected_value, actual_value, regex_expr=True)
+            if not result:
+                return result
 
         return True
 
@@ -46,6 +57,9 @@ class HeadersMatcher(BaseMatcher):
         Returns:
             str|re.Pattern|None
         """
+        if isregex_expr(value):
+            return compile(strip_regex(value))
+
         if isinstance(value, (str, Pattern)):
             return value
 
@@ -1,9 +1,55 @@
 import json
 
-from ..assertion import equal
+from ..comparator import Mismatch, equal
 from .base import BaseMatcher
 
 
+def canonical(data):
+    """
+    Returns the canonical JSON representation of the given data, as it
+    would be parsed from a JSON document.
+
+    Arguments:
+        data (mixed): JSON serializable data.
+
+    Returns:
+        mixed
+    """
+    return json.loads(json.dumps(data))
+
+
+def json_equal(x, y):
+    """
+    Compares two parsed JSON documents by structural value, without type
+    coercion, so ``1``, ``1.0`` and ``true`` are not equal, as in the
+    JSON textual representation.
+
+    Arguments:
+        x (mixed): parsed JSON document.
+        y (mixed): parsed JSON document.
+
+    Returns:
+        bool
+    """
+    if isinstance(x, dict):
+        return (
+            isinstance(y, dict)
+            and len(x) == len(y)
+            and all(key in y and json_equal(value, y[key]) for key, value in x.items())
+        )
+    if isinstance(x, list):
+        return isinstance(y, list) and len(x) == len(y) and all(map(json_equal, x, y))
+    if type(x) is not type(y):
+        return False
+    if isinstance(x, float):
+        return repr(x) == repr(y)
+    return x == y
+
+
+def pretty(data):
+    return json.dumps(data, sort_keys=True, indent=4)
+
+
 class JSONMatcher(BaseMatcher):
     """
     Match JSON documents of equivalent value.
@@ -24,15 +70,29 @@ class JSONMatcher(BaseMatcher):
     Use ``BodyMatcher`` to strictly match the exact textual structure.
     """
 
+    cost = 60
+
     def __init__(self, data):
         BaseMatcher.__init__(self, data)
 
         if isinstance(data, str):
-            self.expectation = json.loads(data)
+            data = json.loads(data)
+
+        self.expectation = data
+
+    @BaseMatcher.expectation.setter
+    def expectation(self, data):
+        self._expectation = data
+        # Canonicalize the expectation once for structural comparisons
+        self._canonical = canonical(data)
 
     @BaseMatcher.matcher
     def match(self, req):
-        x = json.dumps(self.expectation, sort_keys=True, indent=4)
-        y = json.dumps(req.json, sort_keys=True, indent=4)
+        data = req.json
+
+        if json_equal(self._canonical, data):
+            return True
 
-        return equal(x, y)
+        return Mismatch(
+            reason=lambda: str(equal(pretty(self._canonical), pretty(data)))
+        )
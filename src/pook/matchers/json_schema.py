@@ -1,9 +1,40 @@
 import json
+from functools import lru_cache
 
-from jsonschema import validate
+from jsonschema.validators import validator_for
 
 from .base import BaseMatcher
 
+# Maximum number of compiled JSONSchema validators to cache
+CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile(schema):
+    schema = json.loads(schema)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def compile(schema):
+    """
+    Checks and compiles the given JSONSchema definition into a validator.
+
+    Validators are cached and shared between identical schemas, so schema
+    checks and ``$ref`` resolutions are only performed once.
+
+    Arguments:
+        schema (dict): JSONSchema definition.
+
+    Raises:
+        jsonschema.exceptions.SchemaError: if the schema is invalid.
+
+    Returns:
+        jsonschema.protocols.Validator: compiled schema validator.
+    """
+    return _compile(json.dumps(schema, sort_keys=True))
+
 
 class JSONSchemaMatcher(BaseMatcher):
     """
@@ -11,11 +42,20 @@ class JSONSchemaMatcher(BaseMatcher):
     definition schema.
     """
 
+    cost = 80
+
     def __init__(self, schema):
         BaseMatcher.__init__(self, schema)
+        self.expectation = schema
 
+    @BaseMatcher.expectation.setter
+    def expectation(self, schema):
         if isinstance(schema, str):
-            self.expectation = json.loads(schema)
+            schema = json.loads(schema)
+
+        self._expectation = schema
+        # Compile the schema validator once
+        self.validator = compile(schema)
 
     @BaseMatcher.matcher
     def match(self, req):
@@ -25,8 +65,6 @@ class JSONSchemaMatcher(BaseMatcher):
             return False
 
         try:
-            validate(req_json, self.expectation)
+            return self.validator.is_valid(req_json)
         except Exception:
             return False
-
-        return True
@@ -6,8 +6,25 @@ class MethodMatcher(BaseMatcher):
     MethodMatcher implements.
     """
 
+    cost = 10
+
+    def compile(self):
+        if self.negate or not isinstance(self.expectation, str):
+            return BaseMatcher.compile(self)
+
+        if self.expectation == "*":
+            return lambda req: True
+
+        method = self.expectation.lower()
+
+        def match(req):
+            # Fallback to regular matching to report the mismatch
+            return req.method.lower() == method or self.match(req)
+
+        return match
+
     @BaseMatcher.matcher
     def match(self, req):
-        return self.expectation == "*" or self.compare(
+        return self.expectation == "*" or self.check(
             req.method.lower(), self.expectation.lower()
         )
@@ -1,3 +1,4 @@
+from ..regex import compile, isregex_expr, strip_regex
 from .base import BaseMatcher
 
 
@@ -6,6 +7,18 @@ class PathMatcher(BaseMatcher):
     PathMatcher implements an URL path matcher.
     """
 
+    cost = 20
+
+    def __init__(self, path):
+        BaseMatcher.__init__(self, path)
+        self.expectation = path
+
+    @BaseMatcher.expectation.setter
+    def expectation(self, path):
+        self._expectation = path
+        # Precompile regular expression strings once
+        self._path = compile(strip_regex(path)) if isregex_expr(path) else path
+
     @BaseMatcher.matcher
     def match(self, req):
-        return self.compare(self.expectation, req.url.path)
+        return self.check(self._path, req.url.path)
@@ -1,46 +1,87 @@
 from urllib.parse import parse_qs
 
+from ..comparator import Mismatch
 from .base import BaseMatcher, ExistsMatcher
 
 
+def _filter_query(req):
+    query = req.query
+    if query is None:
+        return parse_qs(req.url.query)
+
+    params = {}
+    for key, values in query.items():
+        values = [value for value in values if value]
+        if values:
+            params[key] = values
+    return params
+
+
+def request_query(req):
+    """
+    Returns the URL query params of the given request.
+
+    Reuses the query params already parsed by ``pook.Request``, ignoring
+    blank values as ``urllib.parse.parse_qs`` does by default. The result
+    is memoized on the request, so it must not be mutated.
+
+    Arguments:
+        req (pook.Request): request to get the query params from.
+
+    Returns:
+        dict: query params by name.
+    """
+    if not req.url.query:
+        return {}
+    return req._parse("query", lambda: _filter_query(req))
+
+
 class QueryMatcher(BaseMatcher):
     """
     QueryMatcher implements an URL query params matcher.
     """
 
+    cost = 30
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.expectation = self._expectation
+
+    @BaseMatcher.expectation.setter
+    def expectation(self, query):
+        self._expectation = query
+        # Parse query params once, if needed
+        self._query = parse_qs(query) if isinstance(query, str) else query
+
     def match_query(self, query, req_query):
-        def test(key, param):
+        for key in query:
             match = req_query.get(key)
             if match is None:
                 return False
 
             # Normalize param value
+            param = query[key]
             param = [param] if not isinstance(param, list) else param
 
             # Compare query params
-            [[self.compare(value, expect) for expect in match] for value in param]
+            for value in param:
+                for expect in match:
+                    result = self.check(value, expect)
+                    if not result:
+                        return result
 
-            return True
-
-        return all([test(key, query[key]) for key in query])
+        return True
 
     @BaseMatcher.matcher
     def match(self, req):
-        query = self.expectation
-
-        # Parse and assert type
-        if isinstance(query, str):
-            query = parse_qs(self.expectation)
+        query = self._query
 
         # Validate query params
         if not isinstance(query, dict):
             raise ValueError("query params must be a str or dict")
 
-        # Parse request URL query
-        req_query = parse_qs(req.url.query)
-
         # Match query params
-        return self.match_query(query, req_query)
+        return self.match_query(query, request_query(req))
 
 
 class QueryParameterExistsMatcher(ExistsMatcher):
@@ -51,14 +92,16 @@ class QueryParameterExistsMatcher(ExistsMatcher):
         self.allow_empty = allow_empty
 
     def match(self, request):
-        if not super().match(request):
-            return False
+        result = super().match(request)
+        if not result:
+            return result
 
         if not self.allow_empty:
             attribute = self.get_request_attribute(request)
-            assert not self.is_empty(
-                attribute[self.expectation]
-            ), f"The request's {self.expectation} query parameter was unexpectedly empty."
+            if self.is_empty(attribute[self.expectation]):
+                return Mismatch(
+                    reason=lambda: f"The request's {self.expectation} query parameter was unexpectedly empty."
+                )
 
         return True
 
@@ -1,9 +1,8 @@
 import re
 from urllib.parse import urlparse
 
-from ..regex import isregex
+from ..regex import compile, isregex, strip_regex
 from .base import BaseMatcher
-from .path import PathMatcher
 from .query import QueryMatcher
 
 # URI protocol test regular expression
@@ -15,6 +14,8 @@ class URLMatcher(BaseMatcher):
     URLMatcher implements an URL schema matcher.
     """
 
+    cost = 20
+
     # Matches URL as regular expression
     regex = False
 
@@ -29,41 +30,47 @@ class URLMatcher(BaseMatcher):
         if isregex(url):
             self.regex = True
             self.expectation = url
+            # Precompile the URL regular expression
+            self.pattern = compile(strip_regex(url))
         else:
             # Add protocol prefix in the URL
             if not protoregex.match(url):
                 self.url = f"http://{url}"
             self.expectation = urlparse(self.url)
 
+            # Pre-split the URL components to match
+            url = self.expectation
+            self._scheme = url.scheme
+            self._hostname = url.hostname
+            self._port = url.port
+            self._path = url.path
+            self._query = QueryMatcher(url.query).compile() if url.query else None
+
     def match_path(self, req):
-        path = self.expectation.path
-        if not path:
+        if not self._path:
             return True
-        return PathMatcher(path).match(req)
+        return self.check(self._path, req.url.path)
 
     def match_query(self, req):
-        query = self.expectation.query
-        if not query:
+        if self._query is None:
             return True
-        return QueryMatcher(query).match(req)
+        return self._query(req)
 
     @BaseMatcher.matcher
     def match(self, req):
-        url = self.expectation
-
         # Match as regex
         if self.regex:
-            return self.compare(url, req.url.geturl(), regex_expr=True)
+            return self.check(self.pattern, req.url.geturl())
 
         # Match URL
-        return all(
-            [
-                self.compare(url.scheme, req.url.scheme),
-                self.compare(url.hostname, req.url.hostname),
-                self.compare(url.port or req.url.port, req.url.port),
-                self.match_path(req),
-                self.match_query(req),
-            ]
+        url = req.url
+        port = url.port
+        return (
+            self.check(self._scheme, url.scheme)
+            and self.check(self._hostname, url.hostname)
+            and self.check(self._port or port, port)
+            and self.match_path(req)
+            and self.match_query(req)
         )
 
     def __str__(self):
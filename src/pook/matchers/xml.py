@@ -1,9 +1,8 @@
-import json
-
 import xmltodict
 
-from ..assertion import equal
+from ..comparator import Mismatch, equal
 from .base import BaseMatcher
+from .json import canonical, json_equal, pretty
 
 
 class XMLMatcher(BaseMatcher):
@@ -28,23 +27,37 @@ class XMLMatcher(BaseMatcher):
     Use ``BodyMatcher`` to strictly match the exact textual structure.
     """
 
+    cost = 70
+
     def __init__(self, data):
         BaseMatcher.__init__(self, data)
 
         if isinstance(data, str):
-            self.expectation = xmltodict.parse(data)
+            data = xmltodict.parse(data)
+
+        self.expectation = data
+
+    @BaseMatcher.expectation.setter
+    def expectation(self, data):
+        self._expectation = data
+        # Canonicalize the expectation once for structural comparisons
+        self._canonical = canonical(data)
 
     def compare(self, data):
-        x = json.dumps(xmltodict.parse(data), sort_keys=True)
-        y = json.dumps(self.expectation, sort_keys=True)
+        return self.compare_parsed(xmltodict.parse(data))
+
+    def compare_parsed(self, data):
+        if json_equal(self._canonical, data):
+            return True
 
-        return equal(x, y)
+        return Mismatch(
+            reason=lambda: str(equal(pretty(self._canonical), pretty(data)))
+        )
 
     @BaseMatcher.matcher
     def match(self, req):
-        xml = req.xml
-
-        if not isinstance(xml, str):
+        if not isinstance(req.xml, str):
             return False
 
-        return self.compare(xml)
+        # Reuse the XML document parsed by previously evaluated mocks
+        return self.compare_parsed(req.xmldict)
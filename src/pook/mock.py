@@ -1,13 +1,16 @@
 import functools
+import threading
 from inspect import isfunction, ismethod
 
 from furl import furl
 
 from .constants import TYPES
+from .files import mapfile
 from .helpers import trigger_methods
-from .matcher import MatcherEngine
+from .matcher import MatchError, MatcherEngine
 from .matchers import init as matcher
-from .request import Request
+from .request import Request, RequestView
+from .retention import RequestLog
 from .response import Response
 
 
@@ -74,8 +77,7 @@ class Mock:
             matched.
         persist (bool): Enable persistent mode. Mock won't be flushed even if
             it matched one or multiple times.
-        delay (int): Optional network delay simulation (only applicable when
-            using ``aiohttp`` HTTP client).
+        delay (int): Optional network delay simulation in milliseconds.
         callback (function): optional callback function called every time the
             mock is matched.
         reply (int): Mock response status. Defaults to ``200``.
@@ -142,20 +144,25 @@ class Mock:
         self._matches = 0
         # Stores the simulated error exception
         self._error = None
-        # Stores the optional network delay in milliseconds
-        self._delay = 0
+        # Stores the optional network delay in milliseconds.
+        # Defaults to the engine delay.
+        self._delay = None
         # Stores the mock persistance mode. `True` means it will live forever
         self._persist = False
         # Optional binded engine where the mock belongs to
         self._engine = None
         # Store request-response mock matched calls
-        self._calls = []
+        self._calls = RequestLog()
+        # Guards the mock consumption across concurrent matches
+        self._lock = threading.Lock()
         # Stores the input request instance
         self._request = request or Request()
         # Stores the response mock instance
         self._response = response or Response()
         # Stores the mock matcher engine used for outgoing traffic matching
         self.matchers = MatcherEngine()
+        # Re-route the mock every time its matchers change
+        self.matchers.on_change = self._changed
         # Stores filters used to filter outgoing HTTP requests.
         self.filters = []
         # Stores HTTP request mappers used by the mock.
@@ -461,18 +468,22 @@ class Mock:
         self.add_matcher(matcher("XMLMatcher", xml))
         return self
 
-    def file(self, path):
+    def file(self, path, *, shared=False):
         """
-        Reads the body to match from a disk file.
+        Defines the body to match from a disk file.
+
+        The file is lazily memory-mapped the first time a request body is
+        compared against it.
 
         Arguments:
             path (str): relative or absolute path to file to read from.
+            shared (bool): shares the mapped file with the mocks using the
+                same file path. Defaults to ``False``.
 
         Returns:
             self: current Mock instance.
         """
-        with open(path, "rb") as f:
-            return self.body(f.read())
+        return self.body(mapfile(path, shared=shared))
 
     def add_matcher(self, matcher):
         """
@@ -530,6 +541,7 @@ class Mock:
             self: current Mock instance.
         """
         self._times = times
+        self._changed()
         return self
 
     def persist(self, status=None):
@@ -540,6 +552,7 @@ class Mock:
             self: current Mock instance.
         """
         self._persist = status if isinstance(status, bool) else True
+        self._changed()
         return self
 
     def filter(self, *filters):
@@ -568,6 +581,7 @@ class Mock:
             self: current Mock instance.
         """
         _append_funcs(self.mappers, mappers)
+        self._changed()
         return self
 
     def callback(self, *callbacks):
@@ -587,7 +601,9 @@ class Mock:
     def delay(self, delay=1000):
         """
         Delay network response with certain milliseconds.
-        Only supported by asynchronous HTTP clients, such as ``aiohttp``.
+
+        Asynchronous HTTP clients sleep without blocking the event loop.
+        Overrides the engine default delay, see ``pook.Engine.delay()``.
 
         Arguments:
             delay (int): milliseconds to delay response.
@@ -719,8 +735,11 @@ class Mock:
         """
         Accessor to retrieve the mock match calls registry.
 
+        The retained calls depend on the engine retention policy, see
+        ``pook.Engine.retain()``.
+
         Returns:
-            list[MockCall]
+            pook.retention.RequestLog
         """
         return self._calls
 
@@ -732,7 +751,7 @@ class Mock:
         Returns:
             int
         """
-        return len(self.matches)
+        return self._calls.total
 
     def match(self, request):
         """
@@ -747,15 +766,27 @@ class Mock:
             Exception: if the mock has an exception defined.
 
         Returns:
-            tuple(bool, list[Exception]): ``True`` if the mock matches
+            tuple(bool, list[str]): ``True`` if the mock matches
                 the outgoing HTTP request, otherwise ``False``. Also returns
-                an optional list of error exceptions.
+                an optional list of matching errors.
+        """
+        matches, errors = self._match(request)
+        return matches, [str(error) for error in errors]
+
+    def _match(self, request):
+        """
+        Same as ``Mock.match()``, but matching errors are returned as
+        ``pook.matcher.MatchError`` records, rendered only if needed.
         """
         # Trigger mock filters
         for test in self.filters:
             if not test(request, self):
                 return False, []
 
+        # Mappers may mutate the request, so they work on a real copy
+        if self.mappers:
+            request = request.copy()
+
         # Trigger mock mappers
         for mapper in self.mappers:
             request = mapper(request, self)
@@ -763,22 +794,40 @@ class Mock:
                 raise ValueError("map function must return a request object")
 
         # Match incoming request against registered mock matchers
-        matches, errors = self.matchers.match(request)
+        matches, errors = self.matchers._match(request)
 
         # If not matched, return False
         if not matches:
             return False, errors
 
-        if self._times <= 0:
-            return False, [f"Mock matches request but is expired.\n{self!r}"]
+        # Retain and notify a real copy, detached from the intercepted request
+        if isinstance(request, RequestView):
+            request = request.copy()
+
+        # Consume the mock atomically, so concurrent requests cannot
+        # consume it more times than expected
+        with self._lock:
+            was_done = self.isdone()
+            if self._times <= 0:
+                return False, [
+                    MatchError(
+                        lambda: f"Mock matches request but is expired.\n{self!r}"
+                    )
+                ]
+
+            # Register matched request for further inspecion and reference
+            self._calls.append(request)
 
-        # Register matched request for further inspecion and reference
-        self._calls.append(request)
+            # Increase mock call counter
+            self._matches += 1
+            if not self._persist:
+                self._times -= 1
 
-        # Increase mock call counter
-        self._matches += 1
-        if not self._persist:
-            self._times -= 1
+            finished = not was_done and self.isdone()
+
+        # Notify the engine once the mock is done
+        if finished:
+            self._changed()
 
         # Raise simulated error
         if self._error:
@@ -790,6 +839,29 @@ class Mock:
 
         return True, []
 
+    def compile(self):
+        """
+        Compiles the mock request expectations into predicate functions,
+        so they are not interpreted again on every match.
+
+        Compilation happens automatically on first match or when the mock
+        engine is activated, and it is invalidated every time the mock
+        request expectations change.
+
+        Returns:
+            self: current Mock instance.
+        """
+        self.matchers.compile()
+        return self
+
+    def _changed(self):
+        """
+        Notifies the binded engine that the mock request expectations,
+        TTL or done status have changed.
+        """
+        if self._engine:
+            self._engine.update_mock(self)
+
     def __call__(self, fn):
         """
         Overload Mock instance as callable object in order to be used
@@ -871,7 +943,7 @@ class Mock:
         """
         # Make mock persistent if using default times
         if self._times == 1:
-            self._persist = True
+            self.persist()
 
         # Automatically enable the mock engine, if needed
         if not self._engine.active:
@@ -885,7 +957,7 @@ class Mock:
         Implements context manager exit interface.
         """
         # Force disable mock
-        self._times = 0
+        self.times(0)
 
         # Automatically disable the mock engine, if needed
         if getattr(self, "_disable_engine", False):
@@ -1,7 +1,11 @@
+import functools
 import re
 
 Pattern = re.Pattern
 
+# Maximum number of cached dynamically compiled regular expressions
+CACHE_SIZE = 512
+
 
 def isregex_expr(expr):
     """
@@ -17,7 +21,7 @@ def isregex_expr(expr):
     if not isinstance(expr, str):
         return False
 
-    return all([len(expr) > 3, expr.startswith("re/"), expr.endswith("/")])
+    return len(expr) > 3 and expr.startswith("re/") and expr.endswith("/")
 
 
 def isregex(value):
@@ -33,7 +37,7 @@ def isregex(value):
     """
     if not value:
         return False
-    return any((isregex_expr(value), isinstance(value, Pattern)))
+    return isinstance(value, Pattern) or isregex_expr(value)
 
 
 def strip_regex(expr):
@@ -48,3 +52,47 @@ def strip_regex(expr):
         str
     """
     return expr[3:-1] if isregex_expr(expr) else expr
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _compile(expr, flags):
+    return re.compile(expr, flags)
+
+
+def compile(expr, flags=0):
+    """
+    Compiles the given regular expression, caching the compiled pattern
+    in a bounded LRU cache.
+
+    Already compiled patterns are returned as is.
+
+    Arguments:
+        expr (str|bytes|regex): regular expression to compile.
+        flags (int): optional regular expression flags.
+
+    Raises:
+        re.error: in case of regular expression compilation error.
+
+    Returns:
+        re.Pattern: compiled regular expression.
+    """
+    if isinstance(expr, Pattern):
+        return expr
+    return _compile(expr, flags)
+
+
+def cache_info():
+    """
+    Returns the compiled regular expressions cache statistics.
+
+    Returns:
+        functools._CacheInfo: cache hits, misses, maximum and current size.
+    """
+    return _compile.cache_info()
+
+
+def cache_clear():
+    """
+    Flushes the compiled regular expressions cache.
+    """
+    _compile.cache_clear()
@@ -1,6 +1,9 @@
+import copy as _copy
 import json as _json
 from urllib.parse import parse_qs, urlparse, urlunparse
 
+import xmltodict
+
 from .headers import HTTPHeaderDict
 from .helpers import trigger_methods
 from .matchers.url import protoregex
@@ -35,6 +38,8 @@ class Request:
         self._method = method
         self._extra = kw.get("extra")
         self._headers = HTTPHeaderDict()
+        # Stores the memoized body and query representations, see Request._parse()
+        self._parsed = {}
 
         trigger_methods(self, kw, self.keys)
 
@@ -85,6 +90,8 @@ class Request:
                 if self._url.query
                 else self._query
             )
+            # Invalidate the representations parsed so far
+            self._parsed = {}
 
     @property
     def rawurl(self):
@@ -98,6 +105,8 @@ class Request:
     @query.setter
     def query(self, params):
         self._query = parse_qs(params)
+        # Invalidate the representations parsed so far
+        self._parsed = {}
 
     @property
     def body(self):
@@ -110,11 +119,41 @@ class Request:
             body = body.encode("utf-8", "backslashreplace")
 
         self._body = body
+        # Invalidate the representations parsed so far
+        self._parsed = {}
+
+    def _parse(self, name, parser):
+        """
+        Parses a request body or query representation once, memoizing the
+        result.
+
+        Memoized values are shared across request copies and views, so
+        they must not be mutated. Replacing the request URL, query or body
+        invalidates them.
+
+        Arguments:
+            name (str): memoized representation name.
+            parser (function): representation parser function.
+
+        Returns:
+            mixed: parsed representation.
+        """
+        parsed = self._parsed
+        try:
+            return parsed[name]
+        except KeyError:
+            value = parsed[name] = parser()
+            return value
+
+    @property
+    def text(self):
+        """Request body payload decoded as UTF-8 text."""
+        return self._parse("text", lambda: self.body.decode("utf-8"))
 
     @property
     def json(self):
         """JSON payload body structure to match."""
-        return _json.loads(self.body.decode("utf-8"))
+        return self._parse("json", lambda: _json.loads(self.text))
 
     @json.setter
     def json(self, data):
@@ -126,12 +165,17 @@ class Request:
     @property
     def xml(self):
         """XML payload data structure to match."""
-        return self.body.decode("utf-8")
+        return self.text
 
     @xml.setter
     def xml(self, data):
         self.body = data
 
+    @property
+    def xmldict(self):
+        """XML payload body parsed by ``xmltodict``."""
+        return self._parse("xmldict", lambda: xmltodict.parse(self.text))
+
     def copy(self):
         """
         Copies the current Request object instance for side-effects purposes.
@@ -144,6 +188,19 @@ class Request:
         req._headers = self.headers.copy()
         return req
 
+    def view(self):
+        """
+        Creates a copy-on-write view of the current Request object instance.
+
+        Views share the request state without copying it. The state is only
+        copied if the view is mutated, so the viewed request is never
+        altered.
+
+        Returns:
+            pook.request.RequestView: view of the current Request instance.
+        """
+        return RequestView(self)
+
     def __repr__(self):
         """
         Returns an human friendly readable instance data representation.
@@ -167,3 +224,54 @@ class Request:
 
         separator = "=" * 50
         return (separator + "\n{}\n" + separator).format("\n".join(entries))
+
+
+class RequestView(Request):
+    """
+    Copy-on-write view of a ``pook.Request`` instance.
+
+    Views share the state of the viewed request, so creating them does not
+    allocate any request data. Setting any attribute on the view detaches it
+    from the viewed request by copying the request state first.
+
+    Note: in-place mutations of shared containers, such as
+    ``view.headers['Foo'] = 'bar'``, are not detected. Use ``Request.copy()``
+    if you need to mutate them.
+
+    Arguments:
+        request (pook.Request): request instance to view.
+    """
+
+    __slots__ = ("_shared",)
+
+    def __init__(self, request):
+        object.__setattr__(self, "__dict__", request.__dict__)
+        object.__setattr__(self, "_shared", True)
+
+    def __setattr__(self, name, value):
+        if self._shared:
+            state = self.__dict__.copy()
+            state["_headers"] = state["_headers"].copy()
+            object.__setattr__(self, "__dict__", state)
+            object.__setattr__(self, "_shared", False)
+
+        super().__setattr__(name, value)
+
+    def copy(self):
+        """
+        Copies the viewed Request state into a new Request object instance.
+
+        Returns:
+            pook.Request: copy of the current Request view.
+        """
+        req = Request()
+        req.__dict__ = self.__dict__.copy()
+        req._headers = self.headers.copy()
+        return req
+
+    # Views are pickled and deep copied as plain requests
+    def __reduce__(self):
+        return Request.__new__, (Request,), self.copy().__dict__
+
+    def __deepcopy__(self, memo):
+        return _copy.deepcopy(self.copy(), memo)
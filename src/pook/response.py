@@ -1,8 +1,10 @@
 import json
 
 from .constants import TYPES
+from .files import mapfile
 from .headers import HTTPHeaderDict
 from .helpers import trigger_methods
+from .stream import aiter_chunks, isstream, iter_chunks
 
 
 class Response:
@@ -14,11 +16,11 @@ class Response:
     Arguments:
         status (int): HTTP response status code. Defaults to ``200``.
         headers (dict): HTTP response headers.
-        body (str|bytes): HTTP response body.
+        body (str|bytes|list|iterable): HTTP response body.
         json (str|dict|list): HTTP response JSON body.
         xml (str): HTTP response XML body.
         type (str): HTTP response content MIME type.
-        file (str): file path to HTTP body response.
+        file (str|file): file path or file object to HTTP body response.
     """
 
     _KEY_ORDER = (
@@ -158,10 +160,23 @@ class Response:
         """
         Defines response body data.
 
+        Besides ``str``, ``bytes`` and lists of chunks, the body can be a
+        stream source lazily consumed while the client reads the response,
+        such as an iterator, a generator, an async generator of ``str`` or
+        ``bytes`` chunks or a binary file object. Async generators can only
+        be used with async HTTP clients.
+
+        Generators can only be consumed once. Use a function returning the
+        stream source, such as a generator function, in order to stream a
+        fresh body every time the mock matches.
+
         Arguments:
-            body (str|bytes|list): response body to use.
+            body (str|bytes|list|iterator|function): response body to use.
             chunked (bool): return a chunked response.
 
+        Raises:
+            TypeError: if the body type is not supported.
+
         Returns:
             self: ``pook.Response`` current instance.
         """
@@ -171,6 +186,12 @@ class Response:
             for i, chunk in enumerate(body):
                 if hasattr(chunk, "encode"):
                     body[i] = chunk.encode("utf-8", "backslashreplace")
+        elif not (
+            body is None
+            or isinstance(body, (bytes, bytearray, memoryview))
+            or isstream(body)
+        ):
+            raise TypeError(f"invalid response body type: {type(body).__name__}")
 
         self._body = body
 
@@ -208,18 +229,58 @@ class Response:
         """
         return self.body(xml)
 
-    def file(self, path):
+    def file(self, path, *, shared=False):
         """
         Defines the response body from file contents.
 
+        Disk files are lazily memory-mapped when the mock first matches,
+        and streamed to the client without being copied in memory.
+
+        Binary file objects are streamed lazily while the client reads the
+        response, so they can only be consumed once.
+
         Arguments:
-            path (str): disk file path to load.
+            path (str|file): disk file path to load or binary file object.
+            shared (bool): shares the mapped file with the mocks using the
+                same file path. Defaults to ``False``.
 
         Returns:
             self: ``pook.Response`` current instance.
         """
-        with open(path, "rb") as f:
-            return self.body(f.read())
+        if hasattr(path, "read"):
+            return self.body(path)
+
+        return self.body(mapfile(path, shared=shared))
+
+    @property
+    def stream(self):
+        """
+        ``True`` if the response body is a lazily consumed stream source.
+        """
+        return isstream(self._body)
+
+    def iter_body(self):
+        """
+        Iterates over the response body chunks, lazily consuming stream
+        sources.
+
+        Raises:
+            TypeError: if the body is an async stream source.
+
+        Returns:
+            iterator[bytes]: response body chunks.
+        """
+        return iter_chunks(self._body)
+
+    def aiter_body(self):
+        """
+        Asynchronously iterates over the response body chunks, lazily
+        consuming sync and async stream sources.
+
+        Returns:
+            async iterator[bytes]: response body chunks.
+        """
+        return aiter_chunks(self._body)
 
     @property
     def mock(self):
@@ -0,0 +1,110 @@
+import threading
+from collections import deque
+from collections.abc import Sequence
+
+
+class RequestLog(Sequence):
+    """
+    RequestLog stores the requests intercepted by pook, such as the
+    requests matched by a mock or the unmatched requests of an engine,
+    according to a configurable retention policy.
+
+    By default every request is retained. The retention can be bounded in
+    order to keep memory usage constant under sustained traffic, while the
+    ``total`` number of logged requests is always exact.
+
+    Arguments:
+        limit (int): maximum number of retained requests. Only the most
+            recent ones are kept. ``0`` retains no requests at all, only
+            counting them. Defaults to ``None``, which means unbounded.
+        sample (int): retains one of every ``sample`` logged requests.
+            Defaults to ``1``.
+        bodies (bool): retains the request bodies. Defaults to ``True``.
+
+    Attributes:
+        total (int): exact number of logged requests.
+    """
+
+    def __init__(self, limit=None, sample=1, bodies=True):
+        # Stores the exact number of logged requests
+        self.total = 0
+        self._requests = deque()
+        self._lock = threading.Lock()
+        self.configure(limit=limit, sample=sample, bodies=bodies)
+
+    def configure(self, limit=None, sample=1, bodies=True):
+        """
+        Configures the retention policy, applying it to the already
+        retained requests.
+
+        Arguments:
+            limit (int): maximum number of retained requests.
+            sample (int): retains one of every ``sample`` logged requests.
+            bodies (bool): retains the request bodies.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be a positive number")
+        if sample < 1:
+            raise ValueError("sample must be greater than zero")
+
+        with self._lock:
+            self.limit = limit
+            self.sample = sample
+            self.bodies = bodies
+
+            requests = self._requests
+            if not bodies:
+                requests = map(self._strip, requests)
+            self._requests = deque(requests, maxlen=limit)
+
+    @staticmethod
+    def _strip(request):
+        if request.body is None:
+            return request
+
+        request = request.copy()
+        request.body = None
+        return request
+
+    def append(self, request):
+        """
+        Logs the given request, retaining it if needed.
+
+        Arguments:
+            request (pook.Request): request to log.
+        """
+        with self._lock:
+            self.total += 1
+            if self.limit == 0 or (self.total - 1) % self.sample:
+                return
+
+            if not self.bodies:
+                request = self._strip(request)
+            self._requests.append(request)
+
+    def clear(self):
+        """
+        Flushes the retained requests and resets the total counter.
+        """
+        with self._lock:
+            self.total = 0
+            self._requests.clear()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._requests)[index]
+        return self._requests[index]
+
+    def __len__(self):
+        return len(self._requests)
+
+    def __iter__(self):
+        return iter(list(self._requests))
+
+    def __eq__(self, other):
+        if isinstance(other, (RequestLog, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
@@ -0,0 +1,150 @@
+import io
+from collections.abc import AsyncIterable, Iterator
+
+from .constants import CHUNK_SIZE
+from .files import MappedFile
+
+
+def isstream(body):
+    """
+    Returns ``True`` if the given response body is a lazily consumed
+    stream source, such as an iterator, a generator, an async iterable, a
+    file-like object, a memory-mapped file or a function returning one of
+    them.
+
+    Arguments:
+        body (mixed): response body to test.
+
+    Returns:
+        bool
+    """
+    return (
+        isinstance(body, (Iterator, AsyncIterable, MappedFile))
+        or hasattr(body, "read")
+        or callable(body)
+    )
+
+
+def _source(body):
+    # Functions are called per response, so every response gets a fresh stream
+    return body() if callable(body) else body
+
+
+def _encode(chunk):
+    if hasattr(chunk, "encode"):
+        return chunk.encode("utf-8", "backslashreplace")
+    if not isinstance(chunk, (bytes, bytearray, memoryview)):
+        raise TypeError(f"response body chunks must be str or bytes, not {chunk!r}")
+    return chunk
+
+
+def _read_source(source):
+    while chunk := source.read(CHUNK_SIZE):
+        yield chunk
+
+
+def _iter_source(source):
+    try:
+        chunks = _read_source(source) if hasattr(source, "read") else source
+        for chunk in chunks:
+            yield _encode(chunk)
+    finally:
+        # Release the stream source, such as generators or files
+        close = getattr(source, "close", None)
+        if close:
+            close()
+
+
+def iter_chunks(body):
+    """
+    Iterates over the chunks of the given response body, lazily consuming
+    stream sources.
+
+    Arguments:
+        body (bytes|list|iterable|function): response body.
+
+    Raises:
+        TypeError: if the body is an async stream source.
+
+    Returns:
+        iterator[bytes]: body chunks.
+    """
+    source = _source(body) if isstream(body) else body
+
+    if source is None:
+        return iter(())
+    if isinstance(source, (str, bytes, bytearray, memoryview)):
+        return iter((_encode(source),))
+    if not hasattr(source, "read") and not hasattr(source, "__iter__"):
+        raise TypeError(
+            "async response bodies can only be used with async HTTP clients"
+            if hasattr(source, "__aiter__")
+            else f"invalid response body: {source!r}"
+        )
+
+    return _iter_source(source)
+
+
+async def aiter_chunks(body):
+    """
+    Asynchronously iterates over the chunks of the given response body,
+    lazily consuming sync and async stream sources.
+
+    Arguments:
+        body (bytes|list|iterable|async iterable|function): response body.
+
+    Returns:
+        async iterator[bytes]: body chunks.
+    """
+    source = _source(body) if isstream(body) else body
+
+    if not hasattr(source, "__aiter__"):
+        for chunk in iter_chunks(source):
+            yield chunk
+        return
+
+    try:
+        async for chunk in source:
+            yield _encode(chunk)
+    finally:
+        aclose = getattr(source, "aclose", None)
+        if aclose:
+            await aclose()
+
+
+class BodyReader(io.RawIOBase):
+    """
+    Raw binary file-like object that lazily reads a response body from its
+    chunks, without joining them in memory.
+
+    Wrap it with ``io.BufferedReader`` for buffered reads.
+
+    Arguments:
+        chunks (iterable[bytes]): body chunks.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(chunk).cast("B")
+
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self):
+        # Release the body stream source, such as generators
+        close = getattr(self._chunks, "close", None)
+        if close:
+            close()
+        super().close()
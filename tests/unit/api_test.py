@@ -1,7 +1,14 @@
 import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import urlopen
+
 import pytest
 
-from pook import api
+from pook import Request, api
+from pook.exceptions import PookNoMatches
+from pook.interceptors import HTTPClientInterceptor
 
 
 @pytest.fixture
@@ -77,3 +84,103 @@ async def test_activate_as_decorator_for_async(engine):
     await test_activate()
     assert engine.active is False
     assert engine.isdone() is True
+
+
+def test_use_binds_engine(engine):
+    with api.use() as scoped:
+        assert api.engine() is scoped
+        api.mock("foo.com")
+        assert len(scoped.mocks) == 1
+
+        with api.use() as nested:
+            assert api.engine() is nested
+
+        assert api.engine() is scoped
+        assert nested.active is False
+
+    assert api.engine() is engine
+    assert len(engine.mocks) == 0
+    assert api._dispatcher is None
+
+
+async def test_use_isolated_tasks(engine):
+    async def scenario(host):
+        with api.use() as scoped:
+            mock = api.mock(host)
+            await asyncio.sleep(0)
+
+            assert api.engine() is scoped
+            assert api._dispatcher.match(Request(url=f"http://{host}")) is mock
+
+            with pytest.raises(PookNoMatches):
+                api._dispatcher.match(Request(url="http://baz.com"))
+
+    await asyncio.gather(scenario("foo.com"), scenario("bar.com"))
+    assert api.engine() is engine
+
+
+def test_use_isolated_threads(engine):
+    barrier = threading.Barrier(2)
+
+    def scenario(host):
+        with api.use():
+            api.get(f"http://{host}/").reply(204)
+            barrier.wait(timeout=5)
+            res = urlopen(f"http://{host}/")
+            barrier.wait(timeout=5)
+            return res.status
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = executor.map(scenario, ("foo.com", "bar.com"))
+        assert list(results) == [204, 204]
+
+    assert api._dispatcher is None
+
+
+def test_use_keeps_default_engine(engine):
+    entered, done = threading.Event(), threading.Event()
+
+    def worker():
+        with api.use():
+            entered.set()
+            done.wait(timeout=5)
+
+    api.activate()
+    api.get("http://foo.com/").reply(204)
+    thread = threading.Thread(target=worker)
+    thread.start()
+    try:
+        assert entered.wait(timeout=5)
+        assert urlopen("http://foo.com/").status == 204
+        assert engine.active is True
+    finally:
+        done.set()
+        thread.join()
+
+    assert api._dispatcher is None
+    assert engine.mock_engine.interceptors
+
+
+def test_use_copied_context_threads(engine):
+    with api.use() as scoped:
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(api.engine).result() is engine
+            assert executor.submit(context.run, api.engine).result() is scoped
+
+
+def test_use_disabled_engine(engine):
+    with api.use() as scoped:
+        scoped.disable()
+        assert api._dispatcher.match(Request(url="http://foo.com")) is None
+
+
+def test_delay():
+    with api.use() as engine:
+        api.delay(20)
+        mock = api.get("http://foo.com")
+        interceptor = HTTPClientInterceptor(engine)
+
+        assert interceptor.delay(mock) == 0.02
+        assert interceptor.delay(mock.delay(500)) == 0.5
+        assert interceptor.delay(mock.delay(0)) == 0
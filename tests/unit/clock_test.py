@@ -0,0 +1,98 @@
+import asyncio
+import time
+
+import pytest
+
+from pook.clock import VirtualClock
+
+
+def test_virtual_clock_advance():
+    clock = VirtualClock()
+    start = clock.monotonic()
+
+    clock.sleep(60)
+    clock.advance(0.5)
+
+    assert clock.offset == 60.5
+    assert 60.5 <= clock.monotonic() - start < 61
+
+    with pytest.raises(ValueError):
+        clock.advance(-1)
+
+
+def test_virtual_clock_patch():
+    clock = VirtualClock()
+
+    with clock.patch():
+        start = time.monotonic()
+        time.sleep(30)
+        assert time.monotonic() - start >= 30
+
+    assert clock.offset == 30
+    assert time.sleep is not clock.sleep
+
+
+async def test_virtual_clock_asleep():
+    clock = VirtualClock()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    await clock.asleep(3600)
+
+    assert clock.install(loop)
+    assert loop.time() - start >= 3600
+
+
+async def test_virtual_clock_loop_timers():
+    clock = VirtualClock()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(clock.asleep(60), timeout=10)
+
+    # The sleep is interrupted by the earlier timer
+    assert 9 < clock.offset <= 10
+
+
+async def test_virtual_clock_concurrent_sleeps():
+    clock = VirtualClock()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    await asyncio.gather(*(clock.asleep(1) for _ in range(5)))
+
+    assert 1 <= loop.time() - start < 2
+    assert clock.offset < 2
+
+
+def test_virtual_clocks_are_independent():
+    other = VirtualClock()
+    other.advance(60)
+
+    clock = VirtualClock()
+    clock.sleep(1)
+
+    assert clock.offset == 1
+    assert other.offset == 60
+
+
+async def test_virtual_clock_never_goes_backwards():
+    loop = asyncio.get_running_loop()
+    await VirtualClock().asleep(30)
+    before = loop.time()
+
+    clock = VirtualClock()
+    assert clock.install(loop)
+    assert loop.time() >= before
+
+    await clock.asleep(1)
+    assert loop.time() - before >= 1
+
+
+async def test_virtual_clock_install_keeps_loop_time():
+    clock = VirtualClock()
+    clock.advance(60)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    assert clock.install(loop)
+    assert loop.time() - start < 1
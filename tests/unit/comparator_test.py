@@ -0,0 +1,54 @@
+import re
+
+import pytest
+
+from pook import comparator
+from pook.assertion import equal
+from pook.comparator import Mismatch
+
+
+@pytest.fixture
+def no_test_case(monkeypatch):
+    def fail():
+        raise RuntimeError("unittest.TestCase must not be created")
+
+    monkeypatch.setattr(comparator, "TestCase", fail)
+
+
+def test_equal(no_test_case):
+    assert comparator.equal("foo", "foo") is True
+
+    mismatch = comparator.equal("foo", "bar")
+    assert isinstance(mismatch, Mismatch)
+    assert not mismatch
+
+
+def test_matches(no_test_case):
+    assert comparator.matches(re.compile("f.o"), "foo") is True
+    assert comparator.matches(re.compile("f.o"), b"foo") is True
+    assert comparator.matches("re/^f/", "foo", regex_expr=True) is True
+    assert not comparator.matches(re.compile("bar"), "foo")
+
+
+def test_test(no_test_case):
+    assert comparator.test(re.compile("f.o"), "foo") is True
+    assert comparator.test("foo", "foo") is True
+    assert not comparator.test("foo", "f.o")
+
+
+def test_mismatch_message():
+    assert str(comparator.equal(1, 2)) == "1 != 2"
+    assert str(comparator.equal("foo\n", "bar\n")) == (
+        "'foo\\n' != 'bar\\n'\n- foo\n+ bar\n"
+    )
+    assert str(comparator.matches("re/json/", "xml", regex_expr=True)) == (
+        "Regex didn't match: 'json' not found in 'xml'"
+    )
+    assert str(Mismatch(reason=lambda: "custom reason")) == "custom reason"
+
+
+def test_assertion_equal():
+    assert equal("foo", "foo")
+
+    with pytest.raises(AssertionError, match="'foo' != 'bar'"):
+        equal("foo", "bar")
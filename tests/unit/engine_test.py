@@ -1,6 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from pook import Engine
+from pook import Engine, Request
+from pook.exceptions import PookNoMatches
 
 
 @pytest.fixture
@@ -18,3 +21,83 @@ def test_engine_enable_network(engine):
     assert len(engine.network_filters) == 0
     engine.enable_network("http://foo", "http://bar")
     assert len(engine.network_filters) == 2
+
+
+def match_concurrently(engine, requests, threads=32):
+    def match(_):
+        try:
+            return engine.match(Request(url="http://foo.com"))
+        except PookNoMatches:
+            return None
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(match, range(requests)))
+
+
+def test_engine_concurrent_consumption(engine):
+    mock = engine.mock("foo.com").times(50)
+
+    matched = match_concurrently(engine, 320)
+
+    assert matched.count(mock) == 50
+    assert matched.count(None) == 270
+    assert mock.calls == 50
+    assert mock._times == 0
+    assert mock.isdone()
+
+
+def test_engine_concurrent_registry_changes(engine):
+    mock = engine.mock("foo.com").persist()
+
+    def register(_):
+        engine.remove_mock(engine.mock("foo.com/bar"))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        registered = executor.map(register, range(200))
+        matched = match_concurrently(engine, 200, threads=8)
+        # Raise any error of the concurrent registry changes
+        assert list(registered) == [None] * 200
+
+    assert matched.count(mock) == 200
+    assert engine.mocks == [mock]
+
+
+def test_engine_pending_bookkeeping(engine):
+    once = engine.mock("foo.com")
+    twice = engine.mock("foo.com").times(2)
+    persistent = engine.mock("foo.com").persist()
+
+    assert engine.pending() == 3
+    assert engine.pending_mocks() == [once, twice, persistent]
+    assert not engine.isdone()
+
+    for _ in range(3):
+        engine.match(Request(url="http://foo.com"))
+
+    assert engine.pending_mocks() == [persistent]
+    assert engine.ispending() == 1
+
+    engine.match(Request(url="http://foo.com"))
+    assert engine.pending() == 0
+    assert engine.isdone()
+
+    once.times(1)
+    assert engine.pending_mocks() == [once]
+
+    engine.remove_mock(once)
+    assert engine.isdone()
+
+    engine.flush_mocks()
+    assert engine.pending() == 0
+    assert engine.isdone()
+
+
+def test_engine_pending_keeps_registration_order(engine):
+    first = engine.mock("foo.com")
+    second = engine.mock("foo.com")
+
+    engine.match(Request(url="http://foo.com"))
+    assert engine.pending_mocks() == [second]
+
+    first.times(1)
+    assert engine.pending_mocks() == [first, second]
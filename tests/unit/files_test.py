@@ -0,0 +1,91 @@
+import copy
+
+import pytest
+
+import pook
+from pook import Request
+from pook.files import MappedFile, mapfile
+from pook.stream import CHUNK_SIZE, iter_chunks
+
+
+def test_mapped_file_is_lazy(tmp_path):
+    path = tmp_path / "body.bin"
+    path.write_bytes(b"foo")
+    file = MappedFile(path)
+
+    assert file._view is None
+    assert file.view() == b"foo"
+    assert file.view() is file.view()
+
+
+def test_mapped_file_chunks(tmp_path):
+    path = tmp_path / "body.bin"
+    data = bytes(range(256)) * (CHUNK_SIZE // 128 + 1)
+    path.write_bytes(data)
+
+    chunks = list(iter_chunks(MappedFile(path)))
+
+    assert len(chunks) == 3
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+    assert b"".join(chunks) == data
+
+
+def test_mapped_file_empty(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+
+    assert list(MappedFile(path)) == []
+    assert MappedFile(path) == b""
+
+
+def test_mapped_file_equality(tmp_path):
+    path = tmp_path / "body.bin"
+    path.write_bytes(b"foo")
+    file = MappedFile(path)
+
+    assert file == b"foo"
+    assert file != b"bar"
+    assert file == MappedFile(path)
+    assert copy.deepcopy(file) is file
+
+
+def test_mapped_file_relative_path(tmp_path, monkeypatch):
+    (tmp_path / "body.bin").write_bytes(b"foo")
+    monkeypatch.chdir(tmp_path)
+    file = MappedFile("body.bin")
+
+    monkeypatch.chdir("/")
+    assert file.path == str(tmp_path / "body.bin")
+    assert file == b"foo"
+
+
+def test_mapped_file_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        MappedFile(tmp_path / "missing.bin")
+
+    with pytest.raises(FileNotFoundError):
+        pook.Engine().mock("foo.com", method="POST").file(tmp_path / "missing.bin")
+
+
+def test_mapfile_shared(tmp_path):
+    path = tmp_path / "body.bin"
+    path.write_bytes(b"foo")
+
+    assert mapfile(path) is not mapfile(path)
+    assert mapfile(path, shared=True) is mapfile(str(path), shared=True)
+
+
+def test_file_mocks_are_lazy(tmp_path):
+    path = tmp_path / "body.bin"
+    path.write_bytes(b"foo")
+    engine = pook.Engine()
+    response = engine.mock("foo.com").reply(200).file(path)
+    request = engine.mock("bar.com", method="POST").file(path)
+
+    assert response._body._view is None
+
+    engine.match(Request(url="http://foo.com"))
+    engine.match(Request(method="POST", url="http://bar.com", body=b"foo"))
+
+    assert b"".join(response.iter_body()) == b"foo"
+    assert request.calls == 1
@@ -0,0 +1,153 @@
+import pytest
+
+import pook
+from pook import Engine, Mock, Request
+from pook.exceptions import PookNoMatches
+from pook.index import MockIndex, route
+
+
+@pytest.fixture
+def index():
+    return MockIndex()
+
+
+def candidates(index, method, url):
+    return list(index.candidates(Request(method=method, url=url)))
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    (
+        ({"url": "foo.com"}, (None, "http", "foo.com", None)),
+        ({"url": "https://Foo.com:8443/bar"}, (None, "https", "foo.com", 8443)),
+        ({"url": "foo.com", "method": "POST"}, ("post", "http", "foo.com", None)),
+        ({"url": "foo.com", "method": "*"}, (None, "http", "foo.com", None)),
+        ({"url": pook.regex("foo.com")}, None),
+        ({"method": "GET"}, None),
+    ),
+)
+def test_route(kwargs, expected):
+    assert route(Mock(**kwargs)) == expected
+
+
+def test_route_mappers():
+    assert route(Mock(url="foo.com").map(lambda req, mock: req)) is None
+
+
+def test_index_candidates(index):
+    foo = Mock(url="foo.com", method="GET")
+    bar = Mock(url="bar.com", method="GET")
+    any_method = Mock(url="foo.com")
+    port = Mock(url="foo.com:8080")
+    regex = Mock(url=pook.regex("foo"))
+
+    for mock in (foo, bar, any_method, port, regex):
+        index.add(mock)
+
+    assert len(index) == 5
+    assert candidates(index, "GET", "http://foo.com") == [foo, any_method, regex]
+    assert candidates(index, "POST", "http://foo.com") == [any_method, regex]
+    assert candidates(index, "GET", "http://foo.com:8080") == [
+        foo,
+        any_method,
+        port,
+        regex,
+    ]
+    assert candidates(index, "GET", "https://foo.com") == [regex]
+
+    index.remove(foo)
+    assert foo not in index
+    assert candidates(index, "GET", "http://foo.com") == [any_method, regex]
+
+    index.flush()
+    assert candidates(index, "GET", "http://foo.com") == []
+
+
+def test_index_update_preserves_order(index):
+    first = Mock(url="foo.com")
+    second = Mock(method="GET")
+    index.add(first)
+    index.add(second)
+
+    second.url("foo.com/baz")
+    index.update(second)
+
+    assert candidates(index, "GET", "http://foo.com/baz") == [first, second]
+
+
+def test_engine_reroutes_changed_mocks():
+    engine = Engine()
+    mock = engine.mock("foo.com")
+    mock.method("POST")
+
+    assert engine.match(Request(method="POST", url="http://foo.com")) is mock
+
+
+def test_engine_reports_routed_out_mocks():
+    engine = Engine()
+    engine.mock("foo.com/bar")
+
+    with pytest.raises(PookNoMatches, match="URLMatcher"):
+        engine.match(Request(url="http://baz.com/bar"))
+
+
+def test_index_candidates_snapshot(index):
+    foo = Mock(url="foo.com")
+    index.add(foo)
+
+    matches = index.candidates(Request(url="http://foo.com"))
+    bar = Mock(url="foo.com")
+    index.add(bar)
+    index.remove(foo)
+
+    assert list(matches) == [foo]
+    assert candidates(index, "GET", "http://foo.com") == [bar]
+
+
+def test_index_retire_and_restore(index):
+    first = Mock(url="foo.com")
+    second = Mock(url="foo.com")
+    index.add(first)
+    index.add(second)
+
+    index.retire(first)
+    assert first not in index
+    assert len(index) == 1
+    assert candidates(index, "GET", "http://foo.com") == [second]
+
+    first.method("POST")
+    index.update(first)
+    assert candidates(index, "POST", "http://foo.com") == [second]
+
+    index.restore(first)
+    assert candidates(index, "POST", "http://foo.com") == [first, second]
+
+    index.retire(first)
+    index.remove(first)
+    index.restore(first)
+    assert candidates(index, "POST", "http://foo.com") == [second]
+
+
+def test_engine_retires_exhausted_mocks():
+    engine = Engine()
+    mock = engine.mock("foo.com").times(2)
+    req = Request(url="http://foo.com")
+
+    assert engine.match(req) is mock
+    assert mock in engine._index
+    assert engine.match(req) is mock
+    assert mock not in engine._index
+    assert engine.mocks == [mock]
+    assert engine.isdone()
+
+    with pytest.raises(PookNoMatches, match="Mock matches request but is expired"):
+        engine.match(req)
+
+    engine.debug = False
+    with pytest.raises(PookNoMatches) as excinfo:
+        engine.match(req)
+    assert "expired" not in str(excinfo.value)
+
+    mock.times(1)
+    assert mock in engine._index
+    assert engine.match(req) is mock
@@ -1,7 +1,10 @@
+import asyncio
+
 import aiohttp
 import pytest
 
 import pook
+from pook.stream import CHUNK_SIZE
 from tests.unit.fixtures import BINARY_FILE
 from tests.unit.interceptors.base import StandardTests
 
@@ -149,3 +152,103 @@ async def test_client_params_tuple_of_tuple(local_responder):
         assert res.status == 200
         assert res.url.query.get("key") == "value"
         assert res.url.query.getall("key") == ["value", "another-value"]
+
+
+@pytest.mark.asyncio
+async def test_async_streamed_response(url_404):
+    async def chunks():
+        yield "hello "
+        yield b"from pook"
+
+    pook.get(url_404).reply(200).body(chunks())
+    async with aiohttp.ClientSession() as session:
+        req = await session.get(url_404)
+        assert await req.read() == b"hello from pook"
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_reads(url_404):
+    lines = [b'{"id": %d}\n' % index for index in range(3)]
+    pook.get(url_404).reply(200).body(iter(lines))
+    async with aiohttp.ClientSession() as session:
+        res = await session.get(url_404)
+        assert await res.content.read(3) == b'{"i'
+        assert await res.content.readline() == b'd": 0}\n'
+        assert [line async for line in res.content] == lines[1:]
+        assert res.content.at_eof()
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_iter_chunked(url_404):
+    pook.get(url_404).reply(200).body(b"hello from pook")
+    async with aiohttp.ClientSession() as session:
+        res = await session.get(url_404)
+        chunks = [chunk async for chunk in res.content.iter_chunked(6)]
+        assert chunks == [b"hello ", b"from p", b"ook"]
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_backpressure(url_404):
+    chunk = b"x" * 1024
+    produced = []
+    closed = []
+
+    async def chunks():
+        try:
+            for _ in range(1024):
+                produced.append(chunk)
+                yield chunk
+        finally:
+            closed.append(True)
+
+    pook.get(url_404).reply(200).body(chunks())
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url_404) as res:
+            assert await res.content.read(1) == b"x"
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+            # Feeding pauses once the stream buffer is full
+            assert len(produced) * len(chunk) <= 2 * (CHUNK_SIZE + len(chunk))
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_response_delay_does_not_block_loop(url_404):
+    pook.get(url_404).times(2).delay(100).reply(200)
+    async with aiohttp.ClientSession() as session:
+        start = asyncio.get_running_loop().time()
+        responses = await asyncio.gather(session.get(url_404), session.get(url_404))
+
+        assert [res.status for res in responses] == [200, 200]
+        assert asyncio.get_running_loop().time() - start < 0.2
+
+
+@pytest.mark.asyncio
+async def test_virtual_clock_timeout(url_404):
+    clock = pook.enable_virtual_clock()
+    pook.get(url_404).delay(30_000).reply(200)
+
+    timeout = aiohttp.ClientTimeout(total=5)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        with pytest.raises(asyncio.TimeoutError):
+            await session.get(url_404)
+
+    # The delay is interrupted by the client timeout
+    assert 4 < clock.offset < 6
+
+
+@pytest.mark.asyncio
+async def test_virtual_clock_concurrent_delays(url_404):
+    clock = pook.enable_virtual_clock()
+    pook.get(url_404).times(5).delay(1000).reply(200)
+
+    timeout = aiohttp.ClientTimeout(total=2)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        responses = await asyncio.gather(*(session.get(url_404) for _ in range(5)))
+
+    assert [res.status for res in responses] == [200] * 5
+    assert clock.offset < 2
@@ -1,12 +1,14 @@
 import asyncio
 from collections.abc import Sequence
 import json
+import time
 from typing import Mapping, Optional, Tuple
 
 import pytest
 
 import pook
 from pook.exceptions import PookNoMatches
+from tests.unit.fixtures import BINARY_FILE, BINARY_FILE_PATH
 
 
 class StandardTests:
@@ -229,3 +231,57 @@ class StandardTests:
 
         with pytest.raises(PookNoMatches):
             self.make_request("GET", url_404)
+
+    @pytest.mark.pook
+    def test_streamed_response(self, url_404):
+        """Response bodies can be streamed from generator functions."""
+
+        def chunks():
+            yield "hello "
+            yield b"from pook"
+
+        pook.get(url_404).times(2).reply(200).body(chunks)
+
+        for _ in range(2):
+            status, body, *_ = self.make_request("GET", url_404)
+
+            assert status == 200
+            assert body == b"hello from pook"
+
+    @pytest.mark.pook
+    def test_file_response(self, url_404):
+        """Response bodies can be served from memory-mapped files."""
+        pook.get(url_404).times(2).reply(200).file(BINARY_FILE_PATH)
+
+        for _ in range(2):
+            status, body, *_ = self.make_request("GET", url_404)
+
+            assert status == 200
+            assert body == BINARY_FILE
+
+    @pytest.mark.pook
+    def test_response_delay(self, url_404):
+        """Responses are delayed by the mock or the engine default delay."""
+        pook.delay(50)
+        pook.get(url_404).reply(200)
+        pook.get(url_404).delay(100).reply(200)
+
+        for delay in (0.05, 0.1):
+            start = time.monotonic()
+            status, *_ = self.make_request("GET", url_404)
+
+            assert status == 200
+            assert time.monotonic() - start >= delay
+
+    @pytest.mark.pook
+    def test_virtual_clock_delay(self, url_404):
+        """Response delays advance the virtual clock instead of waiting."""
+        clock = pook.enable_virtual_clock()
+        pook.get(url_404).delay(30_000).reply(200)
+
+        start = time.monotonic()
+        status, *_ = self.make_request("GET", url_404)
+
+        assert status == 200
+        assert 29 < clock.offset <= 30
+        assert time.monotonic() - start < 10
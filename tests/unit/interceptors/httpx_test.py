@@ -87,3 +87,51 @@ def test_redirect_following(url_404):
 
     assert response.status_code == 200
     assert response.read() == b"found at last"
+
+
+async def test_async_streamed_response(url_404):
+    async def chunks():
+        yield "hello "
+        yield b"from pook"
+
+    pook.get(url_404).reply(200).body(chunks())
+
+    async with httpx.AsyncClient() as client:
+        async with client.stream("GET", url_404) as response:
+            body = [chunk async for chunk in response.aiter_bytes()]
+
+    assert b"".join(body) == b"hello from pook"
+
+
+def test_sync_client_async_streamed_response(url_404):
+    async def chunks():
+        yield b"hello"
+
+    pook.get(url_404).reply(200).body(chunks())
+
+    with pytest.raises(TypeError, match="async HTTP clients"):
+        httpx.get(url_404)
+
+
+def test_virtual_clock_read_timeout(url_404):
+    clock = pook.enable_virtual_clock(timeouts=True)
+    pook.get(url_404).delay(30_000).reply(200)
+
+    with pytest.raises(httpx.ReadTimeout):
+        httpx.get(url_404, timeout=5)
+
+    assert clock.offset == 5
+
+
+async def test_async_virtual_clock_read_timeout(url_404):
+    clock = pook.enable_virtual_clock(timeouts=True)
+    pook.get(url_404).times(2).delay(30_000).reply(200)
+
+    async with httpx.AsyncClient(timeout=5) as client:
+        with pytest.raises(httpx.ReadTimeout):
+            await client.get(url_404)
+
+        response = await client.get(url_404, timeout=60)
+        assert response.status_code == 200
+
+    assert 34 < clock.offset <= 35
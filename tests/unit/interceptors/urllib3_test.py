@@ -3,6 +3,7 @@ import urllib3
 import requests
 
 import pook
+from pook.interceptors.urllib3 import FakeChunkedResponseBody
 from tests.unit.fixtures import BINARY_FILE
 from tests.unit.interceptors.base import StandardTests
 
@@ -116,3 +117,107 @@ def test_sets_version(url_404):
     assert resp.status == 200
     assert resp.version == 11
     assert resp.version_string == "HTTP/1.1"
+
+
+@pytest.mark.pook
+def test_streamed_response_read_amt(url_404):
+    pook.get(url_404).reply(200).body(iter([b"hello ", b"from ", b"pook"]))
+
+    http = urllib3.PoolManager()
+    r = http.request("GET", url_404, preload_content=False)
+
+    assert r.read(3) == b"hel"
+    assert list(r.stream(4)) == [b"lo f", b"rom ", b"pook"]
+
+
+def test_chunked_response_generator(url_404):
+    assert_chunked_response(url_404, (c for c in "abc"), [b"a", b"b", b"c"])
+
+
+def test_chunked_response_body_is_lazy():
+    consumed = []
+
+    def chunks():
+        for chunk in (b"foo", b"", b"barbaz"):
+            consumed.append(chunk)
+            yield chunk
+
+    body = FakeChunkedResponseBody(chunks())
+    assert consumed == []
+
+    assert body.readline() == b"3\r\n"
+    assert consumed == [b"foo"]
+    assert body.read(2) == b"fo"
+    assert body.read(3) == b"o\r\n"
+    assert body.readline() == b"6\r\n"
+    assert body.read(4) == b"barb"
+    assert body.read() == b"az\r\n0\r\n\r\n"
+    assert body.read(1) == b""
+
+
+def test_chunked_response_body_close():
+    source = (chunk for chunk in (b"foo", b"bar"))
+    body = FakeChunkedResponseBody(source)
+    body.readline()
+    body.close()
+
+    assert body.closed
+    assert list(source) == []
+
+
+@pytest.mark.pook
+def test_chunked_response_stream(url_404):
+    chunks = [b"x" * 1000] * 100
+    pook.get(url_404).reply(200).body(iter(chunks), chunked=True)
+
+    http = urllib3.PoolManager()
+    r = http.request("GET", url_404, preload_content=False)
+
+    assert list(r.read_chunked()) == chunks
+
+
+@pytest.mark.pook
+def test_virtual_clock_read_timeout(url_404):
+    clock = pook.enable_virtual_clock(timeouts=True)
+    pook.get(url_404).delay(30_000).reply(200)
+
+    http = urllib3.PoolManager(retries=False)
+    with pytest.raises(urllib3.exceptions.ReadTimeoutError):
+        http.request("GET", url_404, timeout=urllib3.Timeout(read=5))
+
+    assert clock.offset == 5
+
+
+@pytest.mark.pook
+def test_total_timeout(url_404):
+    pook.get(url_404).reply(200).body("ok")
+
+    http = urllib3.PoolManager()
+    res = http.request("GET", url_404, timeout=urllib3.Timeout(total=5))
+
+    assert res.status == 200
+    assert res.data == b"ok"
+
+
+@pytest.mark.pook
+def test_virtual_clock_total_timeout(url_404):
+    pook.enable_virtual_clock(timeouts=True)
+    pook.get(url_404).times(2).delay(30_000).reply(200)
+
+    http = urllib3.PoolManager(retries=False)
+    with pytest.raises(urllib3.exceptions.ReadTimeoutError):
+        http.request("GET", url_404, timeout=urllib3.Timeout(total=5))
+
+    res = http.request("GET", url_404, timeout=urllib3.Timeout(read=60, total=90))
+    assert res.status == 200
+
+
+@pytest.mark.pook
+def test_virtual_clock_requests_timeout(url_404):
+    pook.enable_virtual_clock(timeouts=True)
+    pook.get(url_404).times(2).delay(30_000).reply(200)
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        requests.get(url_404, timeout=5)
+
+    assert requests.get(url_404, timeout=60).status_code == 200
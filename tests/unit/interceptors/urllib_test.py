@@ -1,6 +1,6 @@
 from urllib.error import HTTPError
 from urllib.request import Request, urlopen
-from http.client import HTTPResponse
+from http.client import HTTPConnection, HTTPResponse
 
 import pytest
 
@@ -36,8 +36,9 @@ def test_urllib_ssl():
     pook.get("https://example.com").reply(200).body("Hello from pook")
     res = urlopen("https://example.com")
 
-    assert res.read() == b"Hello from pook"
     assert res.length == 15
+    assert res.read() == b"Hello from pook"
+    assert res.length == 0
     assert res.version == 11
 
 
@@ -46,8 +47,9 @@ def test_urllib_clear():
     pook.get("http://example.com").reply(200).body("Hello from pook")
     res = urlopen("http://example.com")
 
-    assert res.read() == b"Hello from pook"
     assert res.length == 15
+    assert res.read() == b"Hello from pook"
+    assert res.length == 0
 
 
 @pytest.mark.pook
@@ -58,3 +60,52 @@ def test_without_body_response_length_is_zero():
     assert res.read() == b""
     assert res.length == 0
     assert res.version == 11
+
+
+@pytest.mark.pook
+def test_incremental_reads():
+    pook.get("http://example.com").reply(200).body("Hello\nfrom pook")
+    res = urlopen("http://example.com")
+
+    assert res.peek(1).startswith(b"H")
+    assert res.readline() == b"Hello\n"
+    assert res.read(4) == b"from"
+
+    buffer = bytearray(3)
+    assert res.readinto(buffer) == 3
+    assert buffer == b" po"
+    assert list(res) == [b"ok"]
+    assert res.read() == b""
+
+
+@pytest.mark.pook
+def test_streamed_read_amt():
+    pook.get("http://example.com").reply(200).body(iter([b"Hello ", b"from pook"]))
+    res = urlopen("http://example.com")
+
+    assert res.length is None
+    assert res.read(3) == b"Hel"
+    assert res.read(6) == b"lo fro"
+    assert res.read() == b"m pook"
+
+
+@pytest.mark.pook
+def test_virtual_clock_timeout():
+    clock = pook.enable_virtual_clock(timeouts=True)
+    pook.get("http://example.com").delay(30_000).reply(200)
+
+    with pytest.raises(TimeoutError):
+        urlopen("http://example.com", timeout=5)
+
+    assert clock.offset == 5
+
+
+@pytest.mark.pook
+def test_http_client_virtual_clock_timeout():
+    pook.enable_virtual_clock(timeouts=True)
+    pook.get("http://example.com").delay(30_000).reply(200)
+
+    conn = HTTPConnection("example.com", timeout=5)
+    conn.request("GET", "/")
+    with pytest.raises(TimeoutError):
+        conn.getresponse()
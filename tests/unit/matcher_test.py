@@ -0,0 +1,190 @@
+import pytest
+
+from pook import Engine, Request
+from pook.exceptions import PookNoMatches
+from pook.matcher import MatchError, MatcherEngine
+from pook.matchers import BaseMatcher, BodyMatcher, MethodMatcher, URLMatcher
+
+
+def test_match_error_is_rendered_lazily():
+    calls = []
+
+    def reason():
+        calls.append(True)
+        return "something went wrong"
+
+    error = MatchError(reason)
+    assert calls == []
+    assert str(error) == "something went wrong"
+    assert calls == [True]
+
+
+def test_match_error_matcher_name():
+    error = MatchError(AssertionError("foo != bar"), BodyMatcher("foo"))
+    assert str(error) == "BodyMatcher: foo != bar"
+
+
+def test_matcher_engine_match_renders_errors():
+    engine = MatcherEngine()
+    engine.add(URLMatcher("http://foo.com"))
+
+    matches, errors = engine.match(Request(url="http://bar.com"))
+    assert not matches
+    assert len(errors) == 1
+    assert isinstance(errors[0], str)
+    assert errors[0].startswith("URLMatcher: ")
+
+
+def test_engine_renders_errors_only_on_no_matches(monkeypatch):
+    rendered = []
+    render = MatchError.__str__
+    monkeypatch.setattr(
+        MatchError, "__str__", lambda self: rendered.append(self) or render(self)
+    )
+
+    engine = Engine()
+    engine.mock("foo.com").body("foo")
+    mock = engine.mock("foo.com").body("bar")
+
+    assert engine.match(Request(url="http://foo.com", body="bar")) is mock
+    assert rendered == []
+
+    with pytest.raises(PookNoMatches, match="BodyMatcher"):
+        engine.match(Request(url="http://foo.com", body="baz"))
+    assert len(rendered) == 2
+
+    engine.debug = False
+    with pytest.raises(PookNoMatches):
+        engine.match(Request(url="http://foo.com", body="baz"))
+    assert len(rendered) == 2
+
+
+class Matcher:
+    def __init__(self, calls, name, result, cost=None):
+        self.calls = calls
+        self.name = name
+        self.result = result
+        if cost is not None:
+            self.cost = cost
+
+    def match(self, request):
+        self.calls.append(self.name)
+        if not self.result:
+            raise AssertionError(f"{self.name} failed")
+        return True
+
+
+def test_matcher_engine_cost_order_and_short_circuit():
+    calls = []
+    engine = MatcherEngine()
+    engine.add(Matcher(calls, "body", False, cost=40))
+    engine.add(Matcher(calls, "method", False, cost=10))
+    engine.add(Matcher(calls, "custom", True))
+
+    matches, errors = engine.match(Request())
+    assert not matches
+    assert calls == ["method"]
+    assert errors == ["Matcher: method failed"]
+
+
+def test_matcher_engine_declaration_order():
+    calls = []
+    engine = MatcherEngine()
+    engine.ordered = False
+    engine.add(Matcher(calls, "body", True, cost=40))
+    engine.add(Matcher(calls, "method", True, cost=10))
+
+    assert engine.match(Request()) == (True, [])
+    assert calls == ["body", "method"]
+
+
+def test_matcher_engine_collect_errors():
+    calls = []
+    engine = MatcherEngine()
+    engine.collect_errors = True
+    engine.add(Matcher(calls, "body", False, cost=40))
+    engine.add(Matcher(calls, "custom", True))
+    engine.add(Matcher(calls, "method", False, cost=10))
+
+    matches, errors = engine.match(Request())
+    assert not matches
+    assert calls == ["method", "body", "custom"]
+    assert errors == ["Matcher: method failed", "Matcher: body failed"]
+
+
+def test_matcher_engine_compile():
+    engine = MatcherEngine()
+    engine.add(BodyMatcher(b"foo"))
+    engine.add(URLMatcher("http://foo.com"))
+
+    compiled = engine.compile()
+    assert [matcher for matcher, _ in compiled] == [engine[1], engine[0]]
+    assert engine.match(Request(url="http://foo.com", body="foo")) == (True, [])
+    assert engine._compiled is compiled
+
+    engine.add(MethodMatcher("POST"))
+    assert engine._compiled is None
+    assert not engine.match(Request(url="http://foo.com", body="foo"))[0]
+
+
+class MethodIsMatcher(BaseMatcher):
+    @BaseMatcher.matcher
+    def match(self, req):
+        return req.method == self.expectation
+
+
+def test_matcher_compile_negate():
+    match = MethodIsMatcher("GET").compile()
+    assert match(Request(method="GET"))
+    assert not match(Request(method="POST"))
+
+    match = MethodIsMatcher("GET", negate=True).compile()
+    assert not match(Request(method="GET"))
+    assert match(Request(method="POST"))
+
+
+def test_matcher_engine_order_change_recompiles():
+    calls = []
+    engine = MatcherEngine()
+    engine.add(Matcher(calls, "body", True, cost=40))
+    engine.add(Matcher(calls, "method", True, cost=10))
+
+    assert engine.match(Request()) == (True, [])
+    assert calls == ["method", "body"]
+
+    calls.clear()
+    engine.ordered = False
+    assert engine.match(Request()) == (True, [])
+    assert calls == ["body", "method"]
+
+
+def test_matcher_engine_list_changes_recompile():
+    changes = []
+    engine = MatcherEngine()
+    engine.on_change = lambda: changes.append(True)
+    engine.add(MethodMatcher("GET"))
+
+    assert engine.match(Request(method="GET"))[0]
+
+    engine[0] = MethodMatcher("POST")
+    assert engine._compiled is None
+    assert engine.match(Request(method="POST"))[0]
+
+    engine.insert(0, MethodMatcher("PUT"))
+    assert not engine.match(Request(method="POST"))[0]
+
+    engine.remove(engine[0])
+    assert engine.match(Request(method="POST"))[0]
+    assert len(changes) == 4
+
+
+def test_matcher_list_changes_reroute_mock():
+    engine = Engine()
+    mock = engine.mock("http://foo.com")
+    index = next(
+        i for i, matcher in enumerate(mock.matchers) if isinstance(matcher, URLMatcher)
+    )
+
+    mock.matchers[index] = URLMatcher("http://bar.com")
+
+    assert engine.match(Request(url="http://bar.com")) is mock
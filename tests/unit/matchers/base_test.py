@@ -27,6 +27,14 @@ def test_base_matcher_compare():
         assert _BaseMatcher("foo").compare("foo", "bar")
 
 
+def test_base_matcher_check():
+    assert _BaseMatcher("foo").check("foo", "foo") is True
+
+    mismatch = _BaseMatcher("foo").check("foo", "bar")
+    assert not mismatch
+    assert str(mismatch).startswith("'foo' != 'bar'")
+
+
 def test_base_matcher_exceptions():
     assert _BaseMatcher("foo").match(None) is None
 
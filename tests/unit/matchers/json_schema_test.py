@@ -0,0 +1,51 @@
+import json
+
+import pytest
+from jsonschema.exceptions import SchemaError
+
+from pook import Request
+from pook.matchers import JSONSchemaMatcher
+
+schema = {
+    "type": "object",
+    "properties": {"foo": {"$ref": "#/definitions/foo"}},
+    "required": ["foo"],
+    "definitions": {"foo": {"type": "string"}},
+}
+
+
+def request(data):
+    return Request(url="http://foo.com", body=json.dumps(data))
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    (
+        pytest.param({"foo": "bar"}, True, id="Valid document"),
+        pytest.param({"foo": 1}, False, id="Invalid reference type"),
+        pytest.param({"bar": "foo"}, False, id="Missing property"),
+        pytest.param({}, False, id="Empty document"),
+    ),
+)
+def test_json_schema_matcher(data, expected):
+    assert JSONSchemaMatcher(schema).match(request(data)) is expected
+
+
+def test_json_schema_matcher_shares_validators():
+    matcher = JSONSchemaMatcher(json.dumps(schema))
+
+    assert matcher.validator is JSONSchemaMatcher(dict(schema)).validator
+    assert matcher.validator is not JSONSchemaMatcher({"type": "array"}).validator
+
+
+def test_json_schema_matcher_invalid_schema():
+    with pytest.raises(SchemaError):
+        JSONSchemaMatcher({"type": "foo"})
+
+
+def test_json_schema_matcher_expectation_change():
+    matcher = JSONSchemaMatcher(schema)
+    matcher.expectation = {"type": "object", "required": ["bar"]}
+
+    assert matcher.match(request({"bar": 1}))
+    assert not matcher.match(request({"foo": "bar"}))
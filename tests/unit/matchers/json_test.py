@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from pook import Request
+from pook.matchers import JSONMatcher
+
+
+def request(data):
+    return Request(url="http://foo.com", body=json.dumps(data))
+
+
+@pytest.mark.parametrize(
+    ("expected", "requested"),
+    (
+        pytest.param(
+            {"a": "one", "b": ["two"]}, {"b": ["two"], "a": "one"}, id="Keys order"
+        ),
+        pytest.param('{"a": 1}', {"a": 1}, id="String expectation"),
+        pytest.param({1: (1, 2.5)}, {"1": [1, 2.5]}, id="Canonical expectation"),
+        pytest.param(
+            [None, True, {"a": []}], [None, True, {"a": []}], id="Nested list"
+        ),
+        pytest.param("{}", {}, id="Empty object"),
+    ),
+)
+def test_json_matcher_match(expected, requested):
+    assert JSONMatcher(expected).match(request(requested)) is True
+
+
+@pytest.mark.parametrize(
+    ("expected", "requested"),
+    (
+        pytest.param({"a": 1}, {"a": 1.0}, id="Integer and float"),
+        pytest.param({"a": 1}, {"a": True}, id="Integer and boolean"),
+        pytest.param({"a": 0}, {"a": None}, id="Integer and null"),
+        pytest.param({"a": 1}, {"a": 1, "b": 2}, id="Extra key"),
+        pytest.param({"a": 1, "b": 2}, {"a": 1, "c": 2}, id="Different key"),
+        pytest.param([1, 2], [2, 1], id="List order"),
+        pytest.param({"a": [1]}, {"a": "[1]"}, id="List and string"),
+    ),
+)
+def test_json_matcher_mismatch(expected, requested):
+    assert not JSONMatcher(expected).match(request(requested))
+
+
+def test_json_matcher_mismatch_message():
+    result = JSONMatcher({"a": 1}).match(request({"a": 2}))
+
+    assert not result
+    assert '-     "a": 1' in str(result)
+    assert '+     "a": 2' in str(result)
@@ -5,6 +5,7 @@ import pytest
 from functools import partial
 
 from pook.request import Request
+from pook.matchers.query import request_query
 from pook.matchers.url import URLMatcher
 
 
@@ -17,8 +18,7 @@ def run_test(match_url, url, matches, regex=False):
     if matches:
         assert URLMatcher(match_url).match(req)
     else:
-        with pytest.raises(Exception):
-            URLMatcher(match_url).match(req)
+        assert not URLMatcher(match_url).match(req)
 
 
 @pytest.mark.parametrize(
@@ -32,6 +32,7 @@ def run_test(match_url, url, matches, regex=False):
         ("http://foo.com/foo/bar", "http://foo.com/foo/bar", True),
         ("http://foo.com/foo/bar/baz", "http://foo.com/foo/bar/baz", True),
         ("http://foo.com/foo?x=y&z=w", "http://foo.com/foo?x=y&z=w", True),
+        ("http://foo.com/foo?x=y", "http://foo.com/foo?x=y&x=&z", True),
         # Invalid cases
         ("http://foo.com", "http://bar.com", False),
         ("http://foo.com:80", "http://foo.com:443", False),
@@ -40,6 +41,7 @@ def run_test(match_url, url, matches, regex=False):
         ("http://foo.com/foo/bar", "http://foo.com/bar/foo", False),
         ("http://foo.com/foo/bar/baz", "http://foo.com/baz/bar/foo", False),
         ("http://foo.com/foo?x=y&z=w", "http://foo.com/foo?x=x&y=y", False),
+        ("http://foo.com/foo?x=y", "http://foo.com/foo?x=", False),
     ),
 )
 def test_url_matcher_urlparse(match_url, url, matches):
@@ -69,3 +71,23 @@ def test_url_matcher_urlparse(match_url, url, matches):
 )
 def test_url_matcher_regex(match_url, url, matches):
     run_test(match_url, url, matches, regex=True)
+
+
+def test_url_matcher_reuses_request_query(monkeypatch):
+    matcher = URLMatcher("http://foo.com/foo?x=y")
+    req = Request(url="http://foo.com/foo?x=y")
+
+    monkeypatch.setattr("pook.matchers.query.parse_qs", None)
+    assert matcher.match(req)
+
+
+def test_url_matcher_memoizes_request_query():
+    req = Request(url="http://foo.com/foo?x=y&z=")
+
+    query = request_query(req)
+    assert query == {"x": ["y"]}
+    assert request_query(req) is query
+    assert request_query(req.view()) is query
+
+    req.url = "http://foo.com/foo?x=z"
+    assert request_query(req) == {"x": ["z"]}
@@ -0,0 +1,67 @@
+import pytest
+
+from pook import Request
+from pook.matchers import XMLMatcher
+
+
+def request(data):
+    return Request(url="http://foo.com", xml=data)
+
+
+@pytest.mark.parametrize(
+    ("expected", "requested", "matches"),
+    (
+        pytest.param(
+            "<root><a>one</a><b>two</b></root>",
+            "<root><b>two</b><a>one</a></root>",
+            True,
+            id="Elements order",
+        ),
+        pytest.param(
+            '<root><a value="one"/><b>two</b></root>',
+            '<root>\n  <a value="one"></a>\n  <b>two</b>\n</root>',
+            True,
+            id="Formatting",
+        ),
+        pytest.param(
+            "<root><a>one</a><a>two</a></root>",
+            "<root><a>one</a><a>two</a></root>",
+            True,
+            id="Repeated elements",
+        ),
+        pytest.param(
+            "<root><a>one</a></root>",
+            "<root><a>two</a></root>",
+            False,
+            id="Different text",
+        ),
+        pytest.param(
+            '<root><a value="one"/></root>',
+            '<root><a value="two"/></root>',
+            False,
+            id="Different attribute",
+        ),
+        pytest.param(
+            "<root><a>one</a><a>two</a></root>",
+            "<root><a>two</a><a>one</a></root>",
+            False,
+            id="Repeated elements order",
+        ),
+        pytest.param(
+            "<root><a>one</a></root>",
+            "<root><a>one</a><b/></root>",
+            False,
+            id="Extra element",
+        ),
+    ),
+)
+def test_xml_matcher(expected, requested, matches):
+    assert bool(XMLMatcher(expected).match(request(requested))) is matches
+
+
+def test_xml_matcher_mismatch_message():
+    result = XMLMatcher("<a>one</a>").match(request("<a>two</a>"))
+
+    assert not result
+    assert '-     "a": "one"' in str(result)
+    assert '+     "a": "two"' in str(result)
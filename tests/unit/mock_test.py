@@ -267,3 +267,13 @@ def test_xml_not_matches(local_responder, mock):
     assert not matches
     assert len(errors) == 1
     assert errors[0].startswith("XMLMatcher:")
+
+
+def test_compile_is_invalidated_on_changes(mock, url_404):
+    mock.url(url_404).compile()
+    assert mock.match(Request(url=url_404, method="POST"))[0]
+
+    mock.times(2).method("GET")
+    matches, errors = mock.match(Request(url=url_404, method="POST"))
+    assert not matches
+    assert errors[0].startswith("MethodMatcher")
@@ -1,6 +1,8 @@
 import re
 
-from pook.regex import isregex, isregex_expr
+import pook
+from pook.matchers import BodyMatcher, PathMatcher
+from pook.regex import cache_clear, cache_info, compile, isregex, isregex_expr
 
 
 def test_isregex_expr():
@@ -39,3 +41,42 @@ def test_isregex():
 
     for case in cases:
         assert isregex(case[0]) is case[1]
+
+
+def test_compile_cache():
+    cache_clear()
+
+    pattern = compile("[a-z]+")
+    assert compile("[a-z]+") is pattern
+    assert compile(pattern) is pattern
+
+    info = cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_matchers_do_not_recompile_regex():
+    mock = pook.Mock(url="re/foo.com/", headers={"Content-Type": "re/json/"})
+    req = pook.Request(
+        url="http://foo.com",
+        headers={"Content-Type": "application/json"},
+    )
+
+    cache_clear()
+    for _ in range(10):
+        assert mock.matchers.match(req) == (True, [])
+
+    assert cache_info().misses == 0
+
+
+def test_path_and_body_matchers_do_not_recompile_regex():
+    path, body = PathMatcher("re/^/users/[0-9]+$/"), BodyMatcher("re/^hello/")
+    req = pook.Request(url="http://foo.com/users/1", body="hello world")
+
+    cache_clear()
+    for _ in range(10):
+        assert path.match(req)
+        assert body.match(req)
+
+    assert not path.match(pook.Request(url="http://foo.com/users/foo"))
+    assert cache_info().hits == cache_info().misses == 0
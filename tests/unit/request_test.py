@@ -0,0 +1,123 @@
+import json
+import pickle
+from copy import deepcopy
+
+from pook import Engine, Request
+from pook.request import RequestView
+
+
+def test_request_view_shares_state():
+    req = Request(url="http://foo.com", headers={"foo": "bar"}, body="hello")
+    view = req.view()
+
+    assert isinstance(view, RequestView)
+    assert view.url is req.url
+    assert view.headers is req.headers
+    assert view.body is req.body
+
+
+def test_request_view_copy_on_write():
+    req = Request(url="http://foo.com", headers={"foo": "bar"})
+    view = req.view()
+
+    view.url = "http://bar.com"
+    view.headers = {"baz": "qux"}
+
+    assert view.url.hostname == "bar.com"
+    assert "baz" in view.headers
+    assert req.url.hostname == "foo.com"
+    assert "baz" not in req.headers
+
+
+def test_request_view_copy():
+    req = Request(url="http://foo.com", headers={"foo": "bar"})
+    copy = req.view().copy()
+
+    assert type(copy) is Request
+    assert copy.headers is not req.headers
+    assert copy.headers == req.headers
+
+
+def test_request_view_pickle_and_deepcopy():
+    req = Request(url="http://foo.com", headers={"foo": "bar"}, body="hello")
+
+    for copy in (pickle.loads(pickle.dumps(req.view())), deepcopy(req.view())):
+        assert type(copy) is Request
+        assert copy.rawurl == req.rawurl
+        assert copy.headers == req.headers
+        assert copy.headers is not req.headers
+        assert copy.body == req.body
+
+
+def test_mock_retains_detached_requests():
+    called = []
+    engine = Engine()
+    mock = engine.mock("foo.com").callback(lambda req, mock: called.append(req))
+
+    req = Request(url="http://foo.com", headers={"foo": "bar"})
+    assert engine.match(req) is mock
+
+    assert type(mock.matches[0]) is Request
+    assert called == [mock.matches[0]]
+    assert mock.matches[0].headers is not req.headers
+    assert deepcopy(mock.matches[0]).headers == req.headers
+
+
+def test_mock_mappers_do_not_mutate_request():
+    def mapper(req, mock):
+        req.headers["foo"] = "baz"
+        return req
+
+    engine = Engine()
+    mock = engine.mock("foo.com").headers({"foo": "baz"}).map(mapper)
+
+    req = Request(url="http://foo.com", headers={"foo": "bar"})
+    assert engine.match(req) is mock
+    assert req.headers["foo"] == "bar"
+
+
+def test_request_body_is_parsed_once(monkeypatch):
+    calls = []
+    loads = json.loads
+
+    def counted_loads(data):
+        calls.append(data)
+        return loads(data)
+
+    monkeypatch.setattr("pook.request._json.loads", counted_loads)
+
+    req = Request(url="http://foo.com", json={"foo": "bar"})
+    assert req.json == {"foo": "bar"}
+    assert req.view().json is req.json
+    assert req.copy().json is req.json
+    assert len(calls) == 1
+
+
+def test_request_body_parsed_cache_invalidation():
+    req = Request(url="http://foo.com", xml="<foo>bar</foo>")
+    assert req.xmldict == {"foo": "bar"}
+
+    view = req.view()
+    view.xml = "<foo>baz</foo>"
+    assert view.xmldict == {"foo": "baz"}
+    assert req.xmldict == {"foo": "bar"}
+
+    req.body = '{"foo": 1}'
+    assert req.text == '{"foo": 1}'
+    assert req.json == {"foo": 1}
+
+
+def test_engine_parses_request_body_once(monkeypatch):
+    engine = Engine()
+    engine.mock("foo.com").json({"foo": 1})
+    engine.mock("foo.com").json({"foo": 2})
+    mock = engine.mock("foo.com").json({"foo": 3})
+
+    calls = []
+    loads = json.loads
+    monkeypatch.setattr(
+        "pook.request._json.loads", lambda data: calls.append(data) or loads(data)
+    )
+
+    assert engine.match(Request(url="http://foo.com", json={"foo": 3})) is mock
+    assert len(calls) == 1
@@ -0,0 +1,94 @@
+import pytest
+
+from pook import Engine, Request
+from pook.retention import RequestLog
+
+
+def requests(count):
+    return [
+        Request(url=f"http://foo.com/{index}", body="foo") for index in range(count)
+    ]
+
+
+def paths(log):
+    return [request.url.path for request in log]
+
+
+def test_request_log_unbounded():
+    log = RequestLog()
+    for request in requests(3):
+        log.append(request)
+
+    assert log.total == 3
+    assert len(log) == 3
+    assert log[0].url.path == "/0"
+    assert log[-1].body == b"foo"
+    assert paths(log[1:]) == ["/1", "/2"]
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    (
+        pytest.param({"limit": 0}, [], id="Counters only"),
+        pytest.param({"limit": 2}, ["/3", "/4"], id="Ring buffer"),
+        pytest.param({"sample": 2}, ["/0", "/2", "/4"], id="Sampling"),
+        pytest.param({"limit": 1, "sample": 2}, ["/4"], id="Sampled ring buffer"),
+    ),
+)
+def test_request_log_retention(policy, expected):
+    log = RequestLog(**policy)
+    for request in requests(5):
+        log.append(request)
+
+    assert log.total == 5
+    assert paths(log) == expected
+
+
+def test_request_log_drop_bodies():
+    request = Request(url="http://foo.com", body="foo")
+    log = RequestLog(bodies=False)
+    log.append(request)
+
+    assert log[0].body is None
+    assert request.body == b"foo"
+
+
+def test_request_log_configure():
+    log = RequestLog()
+    for request in requests(3):
+        log.append(request)
+
+    log.configure(limit=1, bodies=False)
+    assert paths(log) == ["/2"]
+    assert log[0].body is None
+    assert log.total == 3
+
+    log.clear()
+    assert log.total == 0
+    assert len(log) == 0
+
+
+@pytest.mark.parametrize("policy", ({"limit": -1}, {"sample": 0}))
+def test_request_log_invalid_policy(policy):
+    with pytest.raises(ValueError):
+        RequestLog(**policy)
+
+
+def test_engine_retain():
+    engine = Engine(network=True)
+    engine.retain(limit=1, bodies=False)
+    mock = engine.mock("foo.com").persist()
+
+    for request in requests(3):
+        assert engine.match(request) is mock
+        engine.match(Request(url="http://bar.com", body="bar"))
+
+    assert mock.calls == 3
+    assert paths(mock.matches) == ["/2"]
+    assert mock.matches[0].body is None
+    assert engine.unmatched() == 3
+    assert len(engine.unmatched_requests()) == 1
+    assert engine.isunmatched()
+
+    engine.reset()
+    assert engine.mock("foo.com")._calls.limit == 1
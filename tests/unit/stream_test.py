@@ -0,0 +1,99 @@
+import io
+
+import pytest
+
+from pook import Response
+from pook.stream import BodyReader, aiter_chunks, isstream, iter_chunks
+
+
+def generator():
+    yield "foo"
+    yield b"bar"
+
+
+async def async_generator():
+    yield "foo"
+    yield b"bar"
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    (
+        pytest.param(None, False, id="None"),
+        pytest.param(b"foo", False, id="Bytes"),
+        pytest.param([b"foo"], False, id="Chunks"),
+        pytest.param(generator(), True, id="Generator"),
+        pytest.param(generator, True, id="Generator function"),
+        pytest.param(async_generator(), True, id="Async generator"),
+        pytest.param(io.BytesIO(b"foo"), True, id="File"),
+    ),
+)
+def test_isstream(body, expected):
+    assert isstream(body) is expected
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    (
+        pytest.param(None, [], id="None"),
+        pytest.param(b"foo", [b"foo"], id="Bytes"),
+        pytest.param([b"foo", "bar"], [b"foo", b"bar"], id="Chunks"),
+        pytest.param(generator(), [b"foo", b"bar"], id="Generator"),
+        pytest.param(generator, [b"foo", b"bar"], id="Generator function"),
+        pytest.param(lambda: "foo", [b"foo"], id="Function"),
+        pytest.param(io.BytesIO(b"foobar"), [b"foobar"], id="File"),
+    ),
+)
+def test_iter_chunks(body, expected):
+    assert list(iter_chunks(body)) == expected
+
+
+async def test_aiter_chunks():
+    assert [chunk async for chunk in aiter_chunks(async_generator())] == [
+        b"foo",
+        b"bar",
+    ]
+    assert [chunk async for chunk in aiter_chunks(generator)] == [b"foo", b"bar"]
+    assert [chunk async for chunk in aiter_chunks(b"foo")] == [b"foo"]
+
+
+def test_iter_chunks_errors():
+    with pytest.raises(TypeError, match="async HTTP clients"):
+        iter_chunks(async_generator())
+
+    with pytest.raises(TypeError, match="must be str or bytes"):
+        list(iter_chunks([1]))
+
+
+def test_body_reader():
+    reader = io.BufferedReader(BodyReader([b"foo", b"", b"bar", b"baz"]))
+
+    assert reader.read(2) == b"fo"
+    assert reader.read(4) == b"obar"
+    assert reader.read() == b"baz"
+    assert reader.read() == b""
+
+
+def test_body_reader_close():
+    chunks = iter_chunks(generator())
+    reader = BodyReader(chunks)
+    reader.close()
+
+    assert reader.closed
+    assert list(chunks) == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    (
+        pytest.param({"a": 1, "b": 2}, id="Dict"),
+        pytest.param({b"a"}, id="Set"),
+        pytest.param((b"a",), id="Tuple"),
+        pytest.param(1, id="Int"),
+    ),
+)
+def test_isstream_invalid(body):
+    assert not isstream(body)
+
+    with pytest.raises(TypeError, match="invalid response body type"):
+        Response().body(body)